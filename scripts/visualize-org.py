@@ -2,8 +2,9 @@
 """
 Generate an interactive HTML org chart for an AI team plugin.
 
-Produces a two-column layout: vertical workflow pipeline (left) connected
-via SVG lines to agent detail cards (right).
+Produces a single-column page: agent cards, the lifecycle workflow, and
+agent teams. Hovering a card highlights everything related to it; clicking
+opens a detail panel.
 
 Usage:
     # Auto-discover from a plugin directory (recommended):
@@ -20,12 +21,73 @@ Usage:
 """
 
 import argparse
-import glob
+import functools
 import html
 import json
 import os
 import re
+import string
 import sys
+import urllib.parse
+
+_WHITESPACE_RUN = re.compile(r'\s*')
+_RE_AGENT_REF = re.compile(r'@(\w[\w-]*)')
+_RE_DELEGATED = re.compile(r'When Delegated To.*?$', re.DOTALL | re.MULTILINE)
+_RE_SKILL_REF = re.compile(r'[/`](\w[\w-]*)')
+_RE_SPEC = re.compile(r'specializing in ([^.]+)')
+_RE_FOR = re.compile(r'(?:for|covering) ([^.]+)')
+_RE_ARTICLE = re.compile(r'^(?:a|an|the)\s', re.IGNORECASE)
+_RE_SPLIT = re.compile(r',\s*(?:and\s+)?')
+_RE_LIFECYCLE = re.compile(r'(/[\w-]+:[\w-]+(?:\s*→\s*/[\w-]+:[\w-]+)+)')
+_RE_LIST_ITEM = re.compile(r'^\s+-\s+(.+)$')
+_RE_INLINE_LIST = re.compile(r'^\[(.+)\]$')
+_RE_CLI_SECTION = re.compile(r'### CLI Tools\n(.*?)(?=\n###|\n##|\Z)', re.DOTALL)
+_RE_CLI_TOOL = re.compile(r'\*\*([^*]+?)(?:\s*\([^)]*\))?\*\*')
+_RE_CLI_DESC = re.compile(r'\*\*:\s*(.+)')
+_RE_TOOL_ACCESS = re.compile(r'Tool Access.*?(?=^#[^#]|\Z)', re.DOTALL | re.MULTILINE)
+_RE_TEAM = re.compile(r'\*\*([^*]+)\*\*:\s*(@[\w-]+(?:\s*\+\s*@[\w-]+)*)')
+_RE_TEAM_MEMBER = re.compile(r'@([\w-]+)')
+
+
+def _fence_end(content, start):
+    """Return the index just past a fence line's trailing whitespace.
+
+    ``start`` points right after a ``---`` marker. The rest of the line may
+    only contain whitespace; blank lines that follow are swallowed too.
+    Returns -1 if no newline terminates the fence.
+    """
+    ws_end = _WHITESPACE_RUN.match(content, start).end()
+    nl = content.rfind('\n', start, ws_end)
+    return -1 if nl == -1 else nl + 1
+
+
+def _split_frontmatter(content):
+    r"""Split markdown into (raw_meta, body), or None if there is no frontmatter.
+
+    Linear scan for the ``---`` fences — an unterminated fence costs one
+    pass over the file instead of a backtracking regex search. Matches what
+    ``^---\s*\n(.*?)\n---\s*\n(.*)$`` (DOTALL) would capture.
+    """
+    if not content.startswith('---'):
+        return None
+    meta_start = _fence_end(content, 3)
+    if meta_start == -1:
+        return None
+    end = content.find('\n---', meta_start)
+    while end != -1:
+        body_start = _fence_end(content, end + 4)
+        if body_start != -1:
+            return content[meta_start:end], content[body_start:]
+        end = content.find('\n---', end + 1)
+    # The regex would backtrack into the blank lines after the opening fence:
+    # a "---" right after them then closes an all-blank frontmatter.
+    end = meta_start - 1
+    prev_nl = content.rfind('\n', 3, end)
+    if prev_nl != -1 and content.startswith('---', meta_start):
+        body_start = _fence_end(content, meta_start + 3)
+        if body_start != -1:
+            return content[prev_nl + 1:end], content[body_start:]
+    return None
 
 
 def parse_frontmatter(content):
@@ -36,17 +98,16 @@ def parse_frontmatter(content):
     """
     meta = {}
     body = content
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
-    if match:
-        raw_meta = match.group(1)
-        body = match.group(2)
+    split = _split_frontmatter(content)
+    if split:
+        raw_meta, body = split
 
         current_key = None
         current_list = None
 
         for line in raw_meta.split('\n'):
             # List item: "  - value"
-            list_match = re.match(r'^\s+-\s+(.+)$', line)
+            list_match = _RE_LIST_ITEM.match(line)
             if list_match and current_key:
                 if current_list is None:
                     current_list = []
@@ -60,14 +121,14 @@ def parse_frontmatter(content):
 
             # Key-value pair (non-indented lines with colon)
             if ':' in line and not line.startswith(' '):
-                key, val = line.split(':', 1)
+                key, _, val = line.partition(':')
                 key = key.strip()
                 val = val.strip()
                 current_key = key
 
                 if val:
                     # Inline list: [a, b, c]
-                    inline_match = re.match(r'^\[(.+)\]$', val)
+                    inline_match = _RE_INLINE_LIST.match(val)
                     if inline_match:
                         meta[key] = [item.strip().strip('"').strip("'")
                                      for item in inline_match.group(1).split(',')]
@@ -82,21 +143,52 @@ def parse_frontmatter(content):
     return meta, body
 
 
+def _read_text(path):
+    """Read a UTF-8 text file in one call, independent of the locale.
+
+    Text mode keeps universal newlines, so CRLF files parse like LF ones.
+    """
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_text(path, text):
+    """Write UTF-8 text with one pre-encoded binary write."""
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+
+def _sorted_entries(path):
+    """List a directory's non-hidden entries sorted by name, like sorted(glob('*'))."""
+    with os.scandir(path) as it:
+        entries = [entry for entry in it if not entry.name.startswith(".")]
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def _load_json(path):
+    """Read a JSON file with a single buffered binary read."""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+@functools.lru_cache(maxsize=512)
 def shorten_description(desc, max_len=40):
     """Shorten a long description to a card-friendly label."""
     if not desc or len(desc) <= max_len:
         return desc
-    spec_match = re.search(r'specializing in ([^.]+)', desc)
+    # Substring checks let descriptions without the trigger phrase skip the regex
+    spec_match = _RE_SPEC.search(desc) if 'specializing in' in desc else None
     if spec_match:
-        parts = [p.strip() for p in re.split(r',\s*(?:and\s+)?', spec_match.group(1))]
+        parts = [p.strip() for p in _RE_SPLIT.split(spec_match.group(1))]
         if len(parts) >= 2:
             return fix_name_casing(f"{parts[0].title()} & {parts[1]}")
         return fix_name_casing(parts[0].title())
-    for_match = re.search(r'(?:for|covering) ([^.]+)', desc)
+    for_match = _RE_FOR.search(desc) if 'for ' in desc or 'covering ' in desc else None
     if for_match:
         target = for_match.group(1).strip()
-        if not re.match(r'^(?:a|an|the)\s', target, re.IGNORECASE):
-            parts = [p.strip() for p in re.split(r',\s*(?:and\s+)?', target)]
+        if not _RE_ARTICLE.match(target):
+            parts = [p.strip() for p in _RE_SPLIT.split(target)]
             if len(parts) >= 2:
                 return fix_name_casing(f"{parts[0].title()} & {parts[1]}")
             return fix_name_casing(parts[0].title())
@@ -109,19 +201,23 @@ def shorten_description(desc, max_len=40):
     return fix_name_casing(first[:max_len - 3] + "...")
 
 
+# Known abbreviations and compound words, keyed by lowercase form
+NAME_ABBREVIATIONS = {"qa": "QA", "ui": "UI", "ux": "UX", "ui/ux": "UI/UX", "api": "API",
+                      "ci": "CI", "cd": "CD", "pr": "PR", "prd": "PRD",
+                      "cto": "CTO", "ceo": "CEO", "devops": "DevOps", "bizops": "BizOps",
+                      "github": "GitHub", "devtools": "DevTools"}
+
+
+@functools.lru_cache(maxsize=512)
 def fix_name_casing(name):
     """Fix casing for known abbreviations and compound words."""
-    abbreviations = {"qa": "QA", "ui": "UI", "ux": "UX", "ui/ux": "UI/UX", "api": "API",
-                     "ci": "CI", "cd": "CD", "pr": "PR", "prd": "PRD",
-                     "cto": "CTO", "ceo": "CEO", "devops": "DevOps", "bizops": "BizOps",
-                     "github": "GitHub", "devtools": "DevTools"}
-    if name.lower() in abbreviations:
-        return abbreviations[name.lower()]
+    if name.lower() in NAME_ABBREVIATIONS:
+        return NAME_ABBREVIATIONS[name.lower()]
     words = name.split()
     fixed = []
     for w in words:
-        if w.lower() in abbreviations:
-            fixed.append(abbreviations[w.lower()])
+        if w.lower() in NAME_ABBREVIATIONS:
+            fixed.append(NAME_ABBREVIATIONS[w.lower()])
         else:
             fixed.append(w)
     return " ".join(fixed)
@@ -131,6 +227,22 @@ def fix_name_casing(name):
 META_SKILLS = {"sprint", "standup", "scaffold", "help", "kickoff", "story"}
 
 
+def _assign_mcp_hints(section, agent_lowers, mcps):
+    """Give agents the first MCP (in .mcp.json order) named on each Tool Access bullet."""
+    # Plain substring tests: "Content" still matches inside "Content Strategist"
+    mcp_names = [(m["name"].lower(), m["name"]) for m in mcps]
+    for line in section.split('\n'):
+        if not line.strip().startswith('-'):
+            continue
+        line_lower = line.lower()
+        mcp_name = next((name for lower, name in mcp_names if lower in line_lower), None)
+        if mcp_name is None:
+            continue
+        for lower, agent in agent_lowers:
+            if lower in line_lower and mcp_name not in agent["mcps"]:
+                agent["mcps"].append(mcp_name)
+
+
 def build_from_cli(args):
     """Build config dict from CLI arguments for backwards compatibility."""
     agents = [a.strip() for a in args.agents.split(",") if a.strip()] if args.agents else []
@@ -168,26 +280,24 @@ def build_from_plugin(plugin_dir):
     name = "My AI Org"
     plugin_json = os.path.join(plugin_dir, ".claude-plugin", "plugin.json")
     if os.path.isfile(plugin_json):
-        with open(plugin_json) as f:
-            pj = json.load(f)
-            name = pj.get("name", name).replace("-", " ").title()
+        pj = _load_json(plugin_json)
+        name = pj.get("name", name).replace("-", " ").title()
 
     # Read CLAUDE.md for lifecycle and team hints
     claude_content = ""
     claude_md = os.path.join(plugin_dir, "CLAUDE.md")
     if os.path.isfile(claude_md):
-        with open(claude_md) as f:
-            claude_content = f.read()
+        claude_content = _read_text(claude_md)
 
     # Discover agents from agents/*.md
     agents = []
     agent_dir = os.path.join(plugin_dir, "agents")
     if os.path.isdir(agent_dir):
-        for path in sorted(glob.glob(os.path.join(agent_dir, "*.md"))):
-            with open(path) as f:
-                content = f.read()
-            meta, body = parse_frontmatter(content)
-            agent_name = meta.get("name", os.path.splitext(os.path.basename(path))[0])
+        for entry in _sorted_entries(agent_dir):
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            meta, body = parse_frontmatter(_read_text(entry.path))
+            agent_name = meta.get("name", os.path.splitext(entry.name)[0])
             if agent_name.lower() == "observer":
                 continue
             full_desc = meta.get("description", "")
@@ -215,14 +325,14 @@ def build_from_plugin(plugin_dir):
     skill_bodies = {}
     skills_dir = os.path.join(plugin_dir, "skills")
     if os.path.isdir(skills_dir):
-        for skill_dir_path in sorted(glob.glob(os.path.join(skills_dir, "*"))):
-            skill_md = os.path.join(skill_dir_path, "SKILL.md")
+        for entry in _sorted_entries(skills_dir):
+            if not entry.is_dir():
+                continue
+            skill_md = os.path.join(entry.path, "SKILL.md")
             if not os.path.isfile(skill_md):
                 continue
-            with open(skill_md) as f:
-                content = f.read()
-            meta, body = parse_frontmatter(content)
-            skill_name = meta.get("name", os.path.basename(skill_dir_path))
+            meta, body = parse_frontmatter(_read_text(skill_md))
+            skill_name = meta.get("name", entry.name)
             full_desc = meta.get("description", "")
             skills.append({
                 "name": skill_name,
@@ -232,42 +342,43 @@ def build_from_plugin(plugin_dir):
             })
             skill_bodies[skill_name] = body
 
+    # (lowercase display name, agent) pairs, shared by every name-matching pass below
+    agent_lowers = [(a["name"].lower(), a) for a in agents]
+    agent_by_lower = dict(agent_lowers)  # for team resolution
+
     # Map skills to agents using dual-direction parsing
     skill_names = {s["name"] for s in skills}
-    agent_name_lower = {a["name"].lower().replace(" ", "-"): a for a in agents}
-    agent_name_lower.update({a["name"].lower().replace(" ", ""): a for a in agents})
-    agent_name_lower.update({a["name"].lower(): a for a in agents})
+    agent_name_lower = {}
+    for low, a in agent_lowers:
+        for key in {low.replace(" ", "-"), low.replace(" ", ""), low}:
+            agent_name_lower[key] = a
 
     # Forward: scan skill bodies for @agent references (skip meta-skills)
     for skill_name, body in skill_bodies.items():
         if skill_name in META_SKILLS:
             continue
-        for ref in re.findall(r'@(\w[\w-]*)', body):
-            ref_lower = ref.lower()
-            if ref_lower in agent_name_lower:
-                agent = agent_name_lower[ref_lower]
-                if skill_name not in agent["skills"]:
-                    agent["skills"].append(skill_name)
+        for ref in _RE_AGENT_REF.findall(body):
+            agent = agent_name_lower.get(ref.lower())
+            # Skills are appended in scan order, so a repeat can only be the last one
+            if agent and agent["skills"][-1:] != [skill_name]:
+                agent["skills"].append(skill_name)
 
     # Reverse: scan agent "When Delegated To" sections for /skill references
     for agent in agents:
         agent_body = agent.get("markdown", "")
-        delegated_section = re.search(r'When Delegated To.*?$', agent_body, re.DOTALL | re.MULTILINE)
+        delegated_section = _RE_DELEGATED.search(agent_body)
         if delegated_section:
-            section_text = delegated_section.group(0)
-            for sn in skill_names:
-                if sn in META_SKILLS:
-                    continue
-                if f"/{sn}" in section_text or f"`{sn}`" in section_text:
-                    if sn not in agent["skills"]:
-                        agent["skills"].append(sn)
+            have = set(agent["skills"])
+            for sn in _RE_SKILL_REF.findall(delegated_section.group(0)):
+                if sn in skill_names and sn not in META_SKILLS and sn not in have:
+                    have.add(sn)
+                    agent["skills"].append(sn)
 
     # Discover MCPs from .mcp.json
     mcps = []
     mcp_json = os.path.join(plugin_dir, ".mcp.json")
     if os.path.isfile(mcp_json):
-        with open(mcp_json) as f:
-            mcp_data = json.load(f)
+        mcp_data = _load_json(mcp_json)
         for server_name, server_cfg in mcp_data.get("mcpServers", {}).items():
             display_name = fix_name_casing(server_name.replace("-", " ").title())
             cmd = server_cfg.get("command", "")
@@ -278,43 +389,28 @@ def build_from_plugin(plugin_dir):
     # Discover CLI tools from CLAUDE.md
     cli_tools = []
     if claude_content:
-        cli_section = re.search(r'### CLI Tools\n(.*?)(?=\n###|\n##|\Z)', claude_content, re.DOTALL)
+        cli_section = _RE_CLI_SECTION.search(claude_content)
         if cli_section:
             for line in cli_section.group(1).split('\n'):
                 if not line.strip().startswith('-'):
                     continue
-                tool_match = re.search(r'\*\*([^*]+?)(?:\s*\([^)]*\))?\*\*', line)
+                tool_match = _RE_CLI_TOOL.search(line)
                 if tool_match:
                     raw_name = tool_match.group(1).strip()
                     display_name = fix_name_casing(raw_name)
-                    desc_match = re.search(r'\*\*:\s*(.+)', line)
+                    desc_match = _RE_CLI_DESC.search(line)
                     desc = desc_match.group(1).strip() if desc_match else ""
                     cli_tools.append({"name": display_name, "description": desc})
 
     # Assign MCPs to agents based on CLAUDE.md per-bullet hints
     if mcps and claude_content:
-        tool_section = re.search(r'Tool Access.*?(?=^#[^#]|\Z)', claude_content, re.DOTALL | re.MULTILINE)
+        tool_section = _RE_TOOL_ACCESS.search(claude_content)
         if tool_section:
-            for line in tool_section.group(0).split('\n'):
-                if not line.strip().startswith('-'):
-                    continue
-                line_lower = line.lower()
-                matched_mcp = None
-                for mcp in mcps:
-                    if mcp["name"].lower() in line_lower:
-                        matched_mcp = mcp
-                        break
-                if not matched_mcp:
-                    continue
-                for agent in agents:
-                    if agent["name"].lower() in line_lower:
-                        if matched_mcp["name"] not in agent["mcps"]:
-                            agent["mcps"].append(matched_mcp["name"])
+            _assign_mcp_hints(tool_section.group(0), agent_lowers, mcps)
 
     # Fallback: role-based heuristics for agents with no MCPs assigned
-    for agent in agents:
+    for agent_lower, agent in agent_lowers:
         if not agent["mcps"] and mcps:
-            agent_lower = agent["name"].lower()
             tools = agent.get("detail_description", "").lower()
             for mcp in mcps:
                 mcp_lower = mcp["name"].lower()
@@ -324,8 +420,7 @@ def build_from_plugin(plugin_dir):
                     agent["mcps"].append(mcp["name"])
 
     # Assign CLI tools to agents (heuristic: code-related roles get gh)
-    for agent in agents:
-        agent_lower = agent["name"].lower()
+    for agent_lower, agent in agent_lowers:
         for tool in cli_tools:
             tool_lower = tool["name"].lower()
             if "github" in tool_lower and agent_lower in ("engineer", "qa"):
@@ -333,7 +428,8 @@ def build_from_plugin(plugin_dir):
 
     # Parse lifecycle from CLAUDE.md
     lifecycle = []
-    lc_match = re.search(r'(/[\w-]+:[\w-]+(?:\s*→\s*/[\w-]+:[\w-]+)+)', claude_content)
+    # No arrow means no lifecycle line, so skip the regex walk entirely
+    lc_match = _RE_LIFECYCLE.search(claude_content) if '→' in claude_content else None
     if lc_match:
         lifecycle = [s.split(":")[-1].strip() for s in lc_match.group(1).split("→")]
     if not lifecycle:
@@ -342,34 +438,25 @@ def build_from_plugin(plugin_dir):
 
     # Build teams — first try parsing named teams from CLAUDE.md, fall back to skill heuristics
     teams = []
-    agent_names_set = {a["name"].lower() for a in agents}
-    agent_display = {a["name"].lower(): a["name"] for a in agents}
     # Parse "**Team Name**: @agent + @agent + @agent" patterns from CLAUDE.md
-    team_pattern = re.findall(
-        r'\*\*([^*]+)\*\*:\s*(@[\w-]+(?:\s*\+\s*@[\w-]+)*)',
-        claude_content
-    )
+    team_pattern = _RE_TEAM.findall(claude_content)
     for team_name, members_str in team_pattern:
-        member_refs = re.findall(r'@([\w-]+)', members_str)
+        member_refs = _RE_TEAM_MEMBER.findall(members_str)
         resolved = []
         for ref in member_refs:
             ref_lower = ref.lower().replace("-", " ")
-            if ref_lower in agent_display:
-                resolved.append(agent_display[ref_lower])
-            elif ref.lower().replace("-", " ") in agent_names_set:
-                resolved.append(fix_name_casing(ref.replace("-", " ").title()))
+            if ref_lower in agent_by_lower:
+                resolved.append(agent_by_lower[ref_lower]["name"])
         if resolved:
             teams.append({"name": team_name.strip(), "members": resolved})
     # Fallback: build from agent skills if no teams found in CLAUDE.md
     if not teams:
         agent_names = [a["name"] for a in agents]
         if len(agent_names) >= 3:
-            discovery_agents = [a["name"] for a in agents
-                               if any(s in a["skills"] for s in ["discover"])]
-            build_agents = [a["name"] for a in agents
-                           if any(s in a["skills"] for s in ["build", "design", "review"])]
-            ship_agents = [a["name"] for a in agents
-                          if any(s in a["skills"] for s in ["ship", "release-notes"])]
+            skill_sets = [(a["name"], set(a["skills"])) for a in agents]
+            discovery_agents = [n for n, ss in skill_sets if "discover" in ss]
+            build_agents = [n for n, ss in skill_sets if ss & {"build", "design", "review"}]
+            ship_agents = [n for n, ss in skill_sets if ss & {"ship", "release-notes"}]
             if discovery_agents:
                 teams.append({"name": "Discovery Sprint", "members": discovery_agents})
             if build_agents:
@@ -379,7 +466,7 @@ def build_from_plugin(plugin_dir):
 
     # Build alternate paths from meta-skills that exist
     alternate_paths = []
-    meta_skill_names = {s["name"] for s in skills} & META_SKILLS
+    meta_skill_names = skill_names & META_SKILLS
     if "sprint" in meta_skill_names:
         alternate_paths.append({
             "name": "sprint",
@@ -405,14 +492,10 @@ def build_from_plugin(plugin_dir):
         if sk["name"] not in META_SKILLS:
             continue
         # Scan skill body for @agent references
-        sk_agents = []
         body = skill_bodies.get(sk["name"], "")
-        for ref in re.findall(r'@(\w[\w-]*)', body):
-            ref_lower = ref.lower()
-            if ref_lower in agent_name_lower:
-                agent = agent_name_lower[ref_lower]
-                if agent["name"] not in sk_agents:
-                    sk_agents.append(agent["name"])
+        refs = (agent_name_lower.get(ref.lower()) for ref in _RE_AGENT_REF.findall(body))
+        # dict.fromkeys dedupes while keeping first-mention order
+        sk_agents = list(dict.fromkeys(a["name"] for a in refs if a))
         utility_skills.append({
             "name": sk["name"],
             "description": sk.get("description", ""),
@@ -437,11 +520,35 @@ def e(text):
     return html.escape(str(text))
 
 
+def _css_str(text):
+    """Quote text as a CSS string that is also safe inside a <style> element."""
+    return '"' + str(text).replace('\\', '\\\\').replace('"', '\\"').replace('<', '\\3c ') + '"'
+
+
+def _hover_token(key):
+    """Encode a hover key as one whitespace-free token for data-rel's ~= match.
+
+    Skill names from CLI or config mode may contain spaces ("code review");
+    percent-encoding keeps distinct keys distinct.
+    """
+    return urllib.parse.quote(key, safe="")
+
+
 AGENT_COLORS = [
     '#3b82f6', '#ec4899', '#f59e0b', '#10b981', '#06b6d4', '#8b5cf6',
     '#f97316', '#14b8a6', '#a855f7', '#ef4444',
 ]
 
+# Neutral slate for names missing from the color map (matches --orchestrator)
+FALLBACK_COLOR = '#94a3b8'
+
+# Well-known default colors for common agent names
+KNOWN_AGENT_COLORS = {
+    'engineer': '#3b82f6', 'designer': '#ec4899', 'bizops': '#f59e0b',
+    'qa': '#10b981', 'researcher': '#06b6d4', 'content strategist': '#8b5cf6',
+    'content': '#8b5cf6',
+}
+
 PHASE_DEFS = [
     {"label": "Discovery", "color": "#06b6d4"},
     {"label": "Planning", "color": "#ec4899"},
@@ -470,6 +577,13 @@ VP_DEFAULTS = {
     "kickoff": "Collaborative agent team meetings — pre-configured or ad-hoc.",
 }
 
+# Install commands shown (with copy buttons) in the marketing hero
+INSTALL_COMMANDS = [
+    "/plugin marketplace add pcatattacks/solopreneur-plugin",
+    "/plugin install solopreneur@solopreneur",
+    "/solopreneur:help",
+]
+
 # Preferred display order for known agents and VP cards.
 # Agents/skills not in the list sort alphabetically at the end.
 PREFERRED_AGENT_ORDER = [
@@ -479,6 +593,15 @@ PREFERRED_VP_ORDER = [
     "sprint", "observer", "story", "scaffold", "standup", "help",
 ]
 
+# Agents shown on the /sprint branch of the workflow, when present
+SPRINT_AGENT_IDS = ["engineer", "qa", "designer"]
+
+
+@functools.lru_cache(maxsize=512)
+def agent_id(name):
+    """Page id for an agent display name ("UX Designer" -> "ux-designer")."""
+    return name.lower().replace(" ", "-")
+
 
 def _order_key(names_list):
     """Return a sort-key function for preferred ordering."""
@@ -490,18 +613,12 @@ def _order_key(names_list):
 def assign_agent_colors(agents):
     """Assign colors from palette to agents. Returns dict of name -> color."""
     color_map = {}
-    # Well-known default colors for common agent names
-    known = {
-        'engineer': '#3b82f6', 'designer': '#ec4899', 'bizops': '#f59e0b',
-        'qa': '#10b981', 'researcher': '#06b6d4', 'content strategist': '#8b5cf6',
-        'content': '#8b5cf6',
-    }
     used_colors = set()
     for agent in agents:
-        name_lower = agent.get("name", "").lower()
-        if name_lower in known:
-            color_map[agent["name"]] = known[name_lower]
-            used_colors.add(known[name_lower])
+        known = KNOWN_AGENT_COLORS.get(agent.get("name", "").lower())
+        if known:
+            color_map[agent["name"]] = known
+            used_colors.add(known)
     # Assign remaining from palette
     palette_idx = 0
     for agent in agents:
@@ -555,9 +672,9 @@ def build_lifecycle_data(lifecycle, agents, skills, alternate_paths, color_map):
             # Use description as fallback role text
             role = agent.get("description", "")
             agent_roles.append({
-                "id": aname.lower().replace(" ", "-"),
+                "id": agent_id(aname),
                 "name": aname,
-                "color": color_map.get(aname, "#94a3b8"),
+                "color": color_map.get(aname, FALLBACK_COLOR),
                 "role": role,
             })
         steps.append({
@@ -577,291 +694,51 @@ def build_lifecycle_data(lifecycle, agents, skills, alternate_paths, color_map):
     return steps, sprint_alt
 
 
-def generate_html(config, marketing=False):
-    """Generate a self-contained HTML org chart matching the dark-theme design."""
-    name = config.get("name", "My AI Org")
-    agents = config.get("agents", [])
-    skills = config.get("skills", [])
-    teams = config.get("teams", [])
-    lifecycle = config.get("lifecycle", [])
-    alternate_paths = config.get("alternate_paths", [])
-    utility_skills = config.get("utility_skills", [])
-
-    # -- Build data structures --
-    color_map = assign_agent_colors(agents)
-    lifecycle_steps, sprint_alt = build_lifecycle_data(
-        lifecycle, agents, skills, alternate_paths, color_map
-    )
-
-    # Build JS-consumable agent list
-    agent_data = []
-    for agent in agents:
-        tools = list(agent.get("mcps", []))
-        for ct in agent.get("cli_tools", []):
-            tools.append(f"{ct} CLI")
-        agent_data.append({
-            "id": agent["name"].lower().replace(" ", "-"),
-            "name": agent["name"],
-            "color": color_map.get(agent["name"], "#94a3b8"),
-            "model": agent.get("model") or "inherit",
-            "desc": agent.get("description", ""),
-            "tools": tools,
-            "skills": agent.get("skills", []),
-            "knowledge_skills": agent.get("knowledge_skills", []),
-            "mcps": agent.get("mcps", []),
-            "cli_tools": agent.get("cli_tools", []),
-            "detail_description": agent.get("detail_description", "") or agent.get("description", ""),
-        })
-
-    # Sort agents by preferred display order
-    agent_key = _order_key(PREFERRED_AGENT_ORDER)
-    agent_data.sort(key=lambda a: agent_key(a["id"].replace("-", " ")))
-
-    # Build VP cards from utility_skills or alternate_paths
-    vp_cards = []
-    # Always include decision memory (observer) — it's not a skill but a feature
-    vp_cards.append({
-        "icon": VP_ICONS.get("observer", "\U0001f9e0"),
-        "skill": "observer",
-        "name": "Decision memory",
-        "desc": "Every choice you make is logged with your reasoning. Not what changed (git handles that) — but WHY you chose it.",
-        "agents": ["orchestrator"],
-    })
-    if utility_skills:
-        for us in utility_skills:
-            sk_name = us["name"]
-            if sk_name == "kickoff":
-                continue  # kickoff is shown in teams section
-            agent_ids = []
-            for aname in us.get("agents", []):
-                agent_ids.append(aname.lower().replace(" ", "-"))
-            if not agent_ids:
-                agent_ids = ["orchestrator"]
-            vp_cards.append({
-                "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
-                "skill": sk_name,
-                "name": f"/{sk_name}",
-                "desc": us.get("description", "") or VP_DEFAULTS.get(sk_name, ""),
-                "agents": agent_ids,
-            })
-    else:
-        # Fallback: build from alternate_paths for non-plugin configs
-        for ap in alternate_paths:
-            sk_name = ap["name"]
-            if sk_name == "sprint" or sk_name == "kickoff":
-                continue
-            vp_cards.append({
-                "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
-                "skill": sk_name,
-                "name": f"/{sk_name}",
-                "desc": ap.get("description", "") or VP_DEFAULTS.get(sk_name, ""),
-                "agents": ["orchestrator"],
-            })
-        # Add well-known utility skills that might be in skills list
-        skill_names_set = {s["name"] for s in skills}
-        for sk_name in ["story", "scaffold", "help"]:
-            if sk_name in skill_names_set and not any(v["skill"] == sk_name for v in vp_cards):
-                sk_obj = next((s for s in skills if s["name"] == sk_name), None)
-                vp_cards.append({
-                    "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
-                    "skill": sk_name,
-                    "name": f"/{sk_name}",
-                    "desc": sk_obj.get("description", "") if sk_obj else VP_DEFAULTS.get(sk_name, ""),
-                    "agents": ["orchestrator"],
-                })
-
-    # Sort VP cards by preferred display order
-    vp_key = _order_key(PREFERRED_VP_ORDER)
-    vp_cards.sort(key=lambda v: vp_key(v["skill"]))
-
-    # Build team data
-    team_data = []
-    for tm in teams:
-        members = []
-        for mname in tm.get("members", []):
-            members.append({
-                "id": mname.lower().replace(" ", "-"),
-                "name": mname,
-                "color": color_map.get(mname, "#94a3b8"),
-            })
-        team_data.append({
-            "name": tm["name"],
-            "purpose": tm.get("description", ""),
-            "members": members,
-        })
+_RE_STYLE_BLOCK = re.compile(r'(<style>)(.*?)(</style>)', re.S)
+_RE_SCRIPT_BLOCK = re.compile(r'(<script>)(.*?)(</script>)', re.S)
+_RE_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_RE_CSS_SPACE = re.compile(r'\s+')
+_RE_CSS_PUNCT = re.compile(r'\s*([{}:;,>])\s*')
 
-    # Build detail data for the panel
-    detail_data = {}
-    for agent in agents:
-        key = f"agent-{agent['name'].lower().replace(' ', '-')}"
-        detail_data[key] = {
-            "type": "agent",
-            "name": agent["name"],
-            "model": agent.get("model") or "inherit",
-            "desc": agent.get("detail_description", "") or agent.get("description", ""),
-            "tools": list(agent.get("mcps", [])) + [f"{t} (CLI)" for t in agent.get("cli_tools", [])],
-            "skills": agent.get("skills", []),
-            "color": color_map.get(agent["name"], "#94a3b8"),
-        }
-    for sk in skills:
-        key = f"skill-{sk['name']}"
-        used_by = [a["name"] for a in agents if sk["name"] in a.get("skills", [])]
-        # Find which phase this skill belongs to
-        phase_name = ""
-        for step in lifecycle_steps:
-            if step["skill"] == sk["name"]:
-                phase_name = PHASE_DEFS[step["phase"]]["label"] if step["phase"] < len(PHASE_DEFS) else ""
-                break
-        detail_data[key] = {
-            "type": "skill",
-            "name": f"/{sk['name']}",
-            "desc": sk.get("detail_description", "") or sk.get("description", ""),
-            "usedBy": used_by,
-            "phase": phase_name,
-        }
-    for i, tm in enumerate(teams):
-        key = f"team-{i}"
-        detail_data[key] = {
-            "type": "team",
-            "name": tm["name"],
-            "members": tm.get("members", []),
-            "desc": tm.get("description", ""),
-        }
 
-    # Serialize all data to JSON, escaping </ for script safety
-    def safe_json(obj):
-        return json.dumps(obj, ensure_ascii=False).replace('</', r'<\/')
+def _minify_css(css):
+    """Drop comments and collapse whitespace. Safe for the page CSS only:
+    it has no strings with significant spaces and no ' :pseudo' selectors."""
+    css = _RE_CSS_SPACE.sub(" ", _RE_CSS_COMMENT.sub("", css))
+    return _RE_CSS_PUNCT.sub(r"\1", css).replace(";}", "}").strip()
 
-    agents_json = safe_json(agent_data)
-    lifecycle_json = safe_json(lifecycle_steps)
-    phases_json = safe_json(PHASE_DEFS)
-    vp_json = safe_json(vp_cards)
-    teams_json = safe_json(team_data)
-    detail_json = safe_json(detail_data)
-    sprint_json = safe_json(sprint_alt)
-    color_map_json = safe_json(color_map)
 
-    escaped_name = e(name)
+def _minify_js(js):
+    """Drop indentation, blank lines and whole-line // comments. Line breaks
+    are kept so automatic semicolon insertion behaves exactly as before."""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
 
-    # -- OG meta tags (marketing mode only) --
-    if marketing:
-        og_tags = """
-<meta name="description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
-<meta property="og:title" content="Solopreneur — Your Virtual AI Company">
-<meta property="og:description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
-<meta property="og:image" content="https://pcatattacks.github.io/solopreneur-plugin/og-image.png">
-<meta property="og:url" content="https://pcatattacks.github.io/solopreneur-plugin/">
-<meta property="og:type" content="website">
-<meta name="twitter:card" content="summary_large_image">
-<meta name="twitter:title" content="Solopreneur — Your Virtual AI Company">
-<meta name="twitter:description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
-<meta name="twitter:image" content="https://pcatattacks.github.io/solopreneur-plugin/og-image.png">"""
-    else:
-        og_tags = ""
 
-    # -- Hero / header section --
-    copy_svg = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2"/><path d="M5 15H4a2 2 0 01-2-2V4a2 2 0 012-2h9a2 2 0 012 2v1"/></svg>'
-    if marketing:
-        hero_html = f"""
-  <div class="hero">
-    <div class="pill reveal">Claude Code Plugin</div>
-    <h1 class="hero-title reveal">{escaped_name}</h1>
-    <p class="hero-tagline reveal">Your Virtual AI Company</p>
-    <p class="hero-desc reveal">A Claude Code plugin that gives you a full AI team &mdash; specialized agents, guided workflows, and decision memory. Ship products faster as a team of one.</p>
-    <p class="hero-install-label reveal">Open Claude Code in your terminal and run:</p>
-    <div class="install-steps reveal">
-      <div class="install-step">
-        <span class="install-num">1</span>
-        <code id="cmd1">/plugin marketplace add pcatattacks/solopreneur-plugin</code>
-        <button class="copy-btn" onclick="copyCmd('cmd1',this)">{copy_svg}</button>
-      </div>
-      <div class="install-step">
-        <span class="install-num">2</span>
-        <code id="cmd2">/plugin install solopreneur@solopreneur</code>
-        <button class="copy-btn" onclick="copyCmd('cmd2',this)">{copy_svg}</button>
-      </div>
-      <div class="install-step">
-        <span class="install-num">3</span>
-        <code id="cmd3">/solopreneur:help</code>
-        <button class="copy-btn" onclick="copyCmd('cmd3',this)">{copy_svg}</button>
-      </div>
-    </div>
-    <p class="install-prereq reveal">New to Claude Code? <a href="https://code.claude.com/docs/en/quickstart" target="_blank" rel="noopener">Start here &rarr;</a></p>
-    <div class="hero-link-wrap reveal">
-      <a class="hero-link" href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener">
-        <svg viewBox="0 0 24 24" fill="currentColor"><path d="M12 0C5.37 0 0 5.37 0 12c0 5.31 3.435 9.795 8.205 11.385.6.105.825-.255.825-.57 0-.285-.015-1.23-.015-2.235-3.015.555-3.795-.735-4.035-1.41-.135-.345-.72-1.41-1.23-1.695-.42-.225-1.02-.78-.015-.795.945-.015 1.62.87 1.845 1.23 1.08 1.815 2.805 1.305 3.495.99.105-.78.42-1.305.765-1.605-2.67-.3-5.46-1.335-5.46-5.925 0-1.305.465-2.385 1.23-3.225-.12-.3-.54-1.53.12-3.18 0 0 1.005-.315 3.3 1.23.96-.27 1.98-.405 3-.405s2.04.135 3 .405c2.295-1.56 3.3-1.23 3.3-1.23.66 1.65.24 2.88.12 3.18.765.84 1.23 1.905 1.23 3.225 0 4.605-2.805 5.625-5.475 5.925.435.375.81 1.095.81 2.22 0 1.605-.015 2.895-.015 3.3 0 .315.225.69.825.57A12.02 12.02 0 0024 12c0-6.63-5.37-12-12-12z"/></svg>
-        View on GitHub
-      </a>
-    </div>
-  </div>"""
-        footer_html = """
-  <div class="footer">
-    <div class="footer-name reveal">Built by <strong>Pranav Dhingra</strong></div>
-    <div class="footer-links reveal">
-      <a href="https://pranavdhingra.com" target="_blank" rel="noopener">Portfolio</a>
-      <a href="https://linkedin.com/in/pranav-dhingra" target="_blank" rel="noopener">LinkedIn</a>
-      <a href="https://github.com/pcatattacks" target="_blank" rel="noopener">GitHub</a>
-      <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener" style="color:#fbbf24">&#9733; Star</a>
-    </div>
-  </div>"""
-    else:
-        hero_html = f"""
-  <div class="hero hero-simple">
-    <h1 class="hero-title reveal">{escaped_name}</h1>
-    <p class="hero-tagline reveal">AI Org Chart</p>
-  </div>"""
-        footer_html = """
-  <div class="footer">
-    <div class="footer-name reveal">Built with the <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener" style="color:var(--text-secondary);text-decoration:none">Solopreneur plugin</a> for Claude Code</div>
-  </div>"""
-
-    # Star CTA (marketing mode only — shown after VP section)
-    star_svg = '<svg viewBox="0 0 24 24"><path d="M12 .587l3.668 7.431 8.2 1.192-5.934 5.787 1.4 8.168L12 19.896l-7.334 3.269 1.4-8.168L.132 9.21l8.2-1.192z"/></svg>'
-    if marketing:
-        star_cta_html = f"""
-    <div class="star-cta reveal">
-      <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener">
-        {star_svg} Star on GitHub
-      </a>
-    </div>"""
-    else:
-        star_cta_html = ""
-
-    # Beyond-the-lifecycle section (marketing mode only — custom orgs skip this)
-    if marketing:
-        beyond_section_html = f"""
-  <!-- Beyond the lifecycle -->
-  <div class="section" id="beyond-section">
-    <div class="section-eyebrow reveal">Beyond the lifecycle</div>
-    <div class="section-heading reveal">What makes {escaped_name} different</div>
-    <div class="section-desc reveal">The lifecycle gets your product built. These capabilities make the whole experience smarter.</div>
-    <div class="vp-grid" id="vp-grid"></div>{star_cta_html}
-  </div>"""
-    else:
-        beyond_section_html = ""
+def _minify_page(page):
+    page = _RE_STYLE_BLOCK.sub(lambda m: m[1] + _minify_css(m[2]) + m[3], page)
+    return _RE_SCRIPT_BLOCK.sub(lambda m: m[1] + "\n" + _minify_js(m[2]) + "\n" + m[3], page)
 
-    # Build the mini-dots for the HiW flow from actual agent data
-    hiw_dots = ""
-    for agent in agents[:8]:
-        c = color_map.get(agent["name"], "#94a3b8")
-        hiw_dots += f'<span class="mini-dot" style="background:{c}"></span>'
-    if not hiw_dots:
-        hiw_dots = '<span class="mini-dot" style="background:#3b82f6"></span>'
 
-    return f"""<!DOCTYPE html>
+# Page shell for generate_html. A string.Template rather than an f-string so
+# the CSS and JS braces can be written as-is; only $placeholders are filled.
+# The <style> and <script> blocks are minified once, at import.
+PAGE_TEMPLATE = string.Template(_minify_page("""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{escaped_name} &mdash; AI Org Chart</title>
-{og_tags}
+<title>$escaped_name &mdash; AI Org Chart</title>
+$og_tags
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-<link href="https://fonts.googleapis.com/css2?family=Instrument+Serif:ital@0;1&family=Outfit:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
+<link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Instrument+Serif&family=Outfit:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap">
+<link href="https://fonts.googleapis.com/css2?family=Instrument+Serif&family=Outfit:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet" media="print" onload="this.media='all'">
+<noscript><link href="https://fonts.googleapis.com/css2?family=Instrument+Serif&family=Outfit:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet"></noscript>
 <style>
-  *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0}}
+  *,*::before,*::after{box-sizing:border-box;margin:0;padding:0}
 
-  :root {{
+  :root {
     --bg: #0a0e1a;
     --surface: #111627;
     --card: #161c30;
@@ -878,45 +755,45 @@ def generate_html(config, marketing=False):
     --font-mono: 'JetBrains Mono', 'SF Mono', Consolas, monospace;
     --ease: cubic-bezier(0.4, 0, 0.2, 1);
     --chip-w: 130px;
-  }}
+  }
 
-  html {{ scroll-behavior: smooth }}
-  body {{
+  html { scroll-behavior: smooth }
+  body {
     font-family: var(--font-body);
     background: var(--bg);
     color: var(--text);
     line-height: 1.65;
     font-size: 15px;
     -webkit-font-smoothing: antialiased;
-    overflow-x: hidden;
-  }}
+    overflow-x: hidden; overflow-x: clip;
+  }
 
-  ::-webkit-scrollbar {{ width: 5px }}
-  ::-webkit-scrollbar-track {{ background: var(--bg) }}
-  ::-webkit-scrollbar-thumb {{ background: var(--border); border-radius: 3px }}
+  ::-webkit-scrollbar { width: 5px }
+  ::-webkit-scrollbar-track { background: var(--bg) }
+  ::-webkit-scrollbar-thumb { background: var(--border); border-radius: 3px }
 
-  .page {{ max-width: 760px; margin: 0 auto; padding: 0 28px 64px }}
+  .page { max-width: 760px; margin: 0 auto; padding: 0 28px 64px }
 
   /* ── Animations ── */
-  .reveal {{
+  .reveal {
     opacity: 0; transform: translateY(14px);
     transition: opacity 0.5s var(--ease), transform 0.5s var(--ease);
-  }}
-  .reveal.visible {{ opacity: 1; transform: translateY(0) }}
+    will-change: opacity, transform;
+  }
+  .reveal.visible { opacity: 1; transform: translateY(0) }
 
   /* ── Dimming ── */
-  .page.filtering .dimmable {{ opacity: 0.1; transition: opacity 0.25s var(--ease) }}
-  .page.filtering .dimmable.hl {{ opacity: 1 }}
+  .page[data-hl] .dimmable { opacity: 0.1; transition: opacity 0.25s var(--ease) }
 
   /* ════ HERO ════ */
-  .hero {{ padding: 64px 0 28px; position: relative }}
-  .hero::after {{
+  .hero { padding: 64px 0 28px; position: relative }
+  .hero::after {
     content: ''; position: absolute; bottom: 0; left: 0; right: 0;
     height: 1px;
     background: linear-gradient(90deg, transparent, var(--border), transparent);
-  }}
-  .hero-simple {{ padding: 48px 0 36px }}
-  .pill {{
+  }
+  .hero-simple { padding: 48px 0 36px }
+  .pill {
     display: inline-block;
     font-family: var(--font-mono);
     font-size: 0.76rem; font-weight: 500;
@@ -924,180 +801,189 @@ def generate_html(config, marketing=False):
     padding: 5px 14px; border-radius: 100px;
     border: 1px solid var(--border);
     color: var(--text-dim); margin-bottom: 16px;
-  }}
-  .hero-title {{
+  }
+  .hero-title {
     font-family: var(--font-display);
     font-size: clamp(3rem, 7vw, 4.2rem);
     font-weight: 400; line-height: 1.08;
     background: linear-gradient(135deg, #a78bfa 0%, #818cf8 40%, #6366f1 100%);
     -webkit-background-clip: text; -webkit-text-fill-color: transparent;
     background-clip: text; margin-bottom: 6px;
-  }}
-  .hero-tagline {{
+  }
+  .hero-tagline {
     font-size: 1.15rem; color: var(--text-secondary);
     font-weight: 400; margin-bottom: 16px;
-  }}
-  .hero-desc {{
+  }
+  .hero-desc {
     font-size: 0.95rem; color: var(--text-dim);
     margin-bottom: 24px; line-height: 1.7;
-  }}
-  .hero-install-label {{
+  }
+  .hero-install-label {
     font-size: 0.85rem; color: var(--text-secondary);
     margin-bottom: 10px; font-weight: 500;
-  }}
-  .install-prereq {{
+  }
+  .install-prereq {
     text-align: center; margin-top: 16px; margin-bottom: 12px;
     font-size: 0.85rem; color: var(--text-dim);
-  }}
-  .install-prereq a {{
+  }
+  .install-prereq a {
     color: #a78bfa; text-decoration: none;
     transition: color 0.2s;
-  }}
-  .install-prereq a:hover {{ color: #c4b5fd }}
+  }
+  .install-prereq a:hover { color: #c4b5fd }
 
   /* Install steps */
-  .install-steps {{ display: flex; flex-direction: column; gap: 6px; margin-bottom: 16px }}
-  .install-step {{
+  .install-steps { display: flex; flex-direction: column; gap: 6px; margin-bottom: 16px }
+  .install-step {
     display: flex; align-items: center; gap: 10px;
     background: var(--surface); border: 1px solid var(--border);
     border-radius: 8px; padding: 9px 12px 9px 14px;
-  }}
-  .install-num {{
+  }
+  .install-num {
     font-family: var(--font-mono);
     font-size: 0.75rem; font-weight: 600;
     color: var(--text-dim); width: 14px; flex-shrink: 0;
-  }}
-  .install-step code {{
+  }
+  .install-step code {
     font-family: var(--font-mono);
     font-size: 0.82rem; color: var(--text);
     flex: 1; white-space: nowrap;
     overflow: hidden; text-overflow: ellipsis;
-  }}
-  .copy-btn {{
+  }
+  .copy-btn {
     background: transparent; border: 1px solid var(--border);
     border-radius: 5px; color: var(--text-dim);
     cursor: pointer; padding: 4px 8px;
     display: flex; align-items: center;
     transition: all 0.2s var(--ease); flex-shrink: 0;
-  }}
-  .copy-btn:hover {{ border-color: var(--text-secondary); color: var(--text-secondary) }}
-  .copy-btn.copied {{ border-color: #10b981; color: #10b981 }}
-  .copy-btn svg {{ width: 13px; height: 13px }}
-
-  .hero-link-wrap {{ text-align: center }}
-  .hero-link {{
+  }
+  .copy-btn:hover { border-color: var(--text-secondary); color: var(--text-secondary) }
+  .copy-btn.copied { border-color: #10b981; color: #10b981 }
+  .copy-btn svg { width: 13px; height: 13px }
+  .copy-btn .ico-check, .copy-btn.copied .ico-copy { display: none }
+  .copy-btn.copied .ico-check { display: block }
+
+  .hero-link-wrap { text-align: center }
+  .hero-link {
     display: inline-flex; align-items: center; gap: 6px;
     font-size: 0.82rem; color: var(--text-dim);
     text-decoration: none; transition: color 0.2s;
-  }}
-  .hero-link:hover {{ color: var(--text-secondary) }}
-  .hero-link svg {{ width: 15px; height: 15px; opacity: 0.6 }}
+  }
+  .hero-link:hover { color: var(--text-secondary) }
+  .hero-link svg { width: 15px; height: 15px; opacity: 0.6 }
 
-  .star-cta {{
+  .star-cta {
     text-align: center; padding: 32px 0 0;
-  }}
-  .star-cta a {{
+  }
+  .star-cta a {
     display: inline-flex; align-items: center; gap: 7px;
     font-size: 0.85rem; color: var(--text-dim);
     text-decoration: none; transition: color 0.25s, border-color 0.25s;
     padding: 8px 20px; border-radius: 8px;
     border: 1px solid var(--border);
-  }}
-  .star-cta a:hover {{ color: #fbbf24; border-color: rgba(251,191,36,0.35) }}
-  .star-cta a svg {{ width: 15px; height: 15px; fill: currentColor }}
+  }
+  .star-cta a:hover { color: #fbbf24; border-color: rgba(251,191,36,0.35) }
+  .star-cta a svg { width: 15px; height: 15px; fill: currentColor }
 
   /* ════ SECTIONS ════ */
-  .section {{ padding: 48px 0 0 }}
-  .section-eyebrow {{
+  .section {
+    /* Skip style/layout/paint of sections until they near the viewport;
+       'auto' remembers the real height once a section has rendered */
+    content-visibility: auto; contain-intrinsic-size: auto 600px;
+    /* That also clips paint to the section box, so pad it out (and pull the
+       margins back) far enough to keep card hover lifts and shadows visible */
+    padding: 48px 28px 32px; margin: 0 -28px -32px;
+  }
+  .section-eyebrow {
     font-family: var(--font-mono);
     font-size: 0.75rem; font-weight: 500;
     letter-spacing: 0.1em; text-transform: uppercase;
     color: var(--text-dim); margin-bottom: 8px;
-  }}
-  .section-heading {{
+  }
+  .section-heading {
     font-family: var(--font-display);
     font-size: 1.55rem; font-weight: 400;
     color: var(--text); margin-bottom: 6px;
     line-height: 1.25;
-  }}
-  .section-desc {{
+  }
+  .section-desc {
     font-size: 0.92rem; color: var(--text-dim);
     margin-bottom: 24px; line-height: 1.65;
-  }}
+  }
 
   /* ════ HOW IT WORKS ════ */
-  .hiw-flow {{
+  .hiw-flow {
     display: flex; align-items: center; justify-content: center;
     gap: 14px; padding: 4px 0; flex-wrap: wrap;
-  }}
-  .hiw-node {{
+  }
+  .hiw-node {
     text-align: center; padding: 10px 16px;
     border-radius: 10px; font-size: 0.82rem; font-weight: 500;
-  }}
-  .hiw-you {{
+  }
+  .hiw-you {
     background: linear-gradient(135deg, rgba(167,139,250,0.08), rgba(99,102,241,0.08));
     border: 1px solid rgba(167,139,250,0.2); color: #a78bfa;
-  }}
-  .hiw-claude {{
+  }
+  .hiw-claude {
     background: rgba(148,163,184,0.06);
     border: 1px solid rgba(148,163,184,0.15); color: var(--orchestrator);
-  }}
-  .hiw-node .hiw-label {{
+  }
+  .hiw-node .hiw-label {
     font-size: 0.75rem; color: var(--text-dim);
     display: block; margin-bottom: 2px;
     font-family: var(--font-mono); letter-spacing: 0.08em; text-transform: uppercase;
-  }}
-  .hiw-agents-node {{
+  }
+  .hiw-agents-node {
     background: rgba(255,255,255,0.02);
     border: 1px solid var(--border);
     display: flex; gap: 5px; padding: 10px 14px;
     border-radius: 10px;
-  }}
-  .hiw-agents-node .mini-dot {{ width: 9px; height: 9px; border-radius: 50% }}
-  .hiw-arrow {{ color: var(--text-dim); font-family: var(--font-mono); font-size: 0.85rem }}
+  }
+  .hiw-agents-node .mini-dot { width: 9px; height: 9px; border-radius: 50% }
+  .hiw-arrow { color: var(--text-dim); font-family: var(--font-mono); font-size: 0.85rem }
 
   /* ════ AGENT CARDS ════ */
-  .agent-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 14px }}
-  @media (max-width: 600px) {{ .agent-grid {{ grid-template-columns: repeat(2, 1fr) }} }}
+  .agent-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 14px }
+  @media (max-width: 600px) { .agent-grid { grid-template-columns: repeat(2, 1fr) } }
 
-  .agent-card {{
+  .agent-card {
     background: var(--card); border: 1px solid var(--border);
     border-radius: 10px; padding: 16px 18px;
     cursor: pointer; transition: all 0.25s var(--ease);
-    position: relative; overflow: hidden;
-  }}
-  .agent-card::before {{
+    position: relative; overflow: hidden; contain: layout paint;
+  }
+  .agent-card::before {
     content: ''; position: absolute; top: 0; left: 0; right: 0; height: 2px;
     background: var(--agent-color); opacity: 0.6;
-  }}
-  .agent-card:hover {{
+  }
+  .agent-card:hover {
     border-color: var(--agent-color); background: var(--card-hover);
     transform: translateY(-2px); box-shadow: 0 6px 24px rgba(0,0,0,0.3);
-  }}
-  .agent-top {{ display: flex; align-items: center; gap: 8px; margin-bottom: 6px }}
-  .agent-dot {{ width: 8px; height: 8px; border-radius: 50%; background: var(--agent-color); flex-shrink: 0 }}
-  .agent-name {{ font-weight: 600; font-size: 0.92rem; flex: 1 }}
-  .agent-role {{ font-size: 0.84rem; color: var(--text-secondary); line-height: 1.5 }}
-  .panel-model-badge {{
+  }
+  .agent-top { display: flex; align-items: center; gap: 8px; margin-bottom: 6px }
+  .agent-dot { width: 8px; height: 8px; border-radius: 50%; background: var(--agent-color); flex-shrink: 0 }
+  .agent-name { font-weight: 600; font-size: 0.92rem; flex: 1 }
+  .agent-role { font-size: 0.84rem; color: var(--text-secondary); line-height: 1.5 }
+  .panel-model-badge {
     font-family: var(--font-mono);
     font-size: 0.75rem; font-weight: 600;
     letter-spacing: 0.04em; text-transform: uppercase;
     padding: 3px 8px; border-radius: 4px;
     display: inline-block;
-  }}
-  .panel-model-explicit {{ background: rgba(129,140,248,0.12); color: #818cf8 }}
-  .panel-model-inherit {{ background: rgba(148,163,184,0.08); color: var(--text-dim) }}
+  }
+  .panel-model-explicit { background: rgba(129,140,248,0.12); color: #818cf8 }
+  .panel-model-inherit { background: rgba(148,163,184,0.08); color: var(--text-dim) }
 
   /* ════ WORKFLOW ════ */
-  .workflow {{ position: relative; padding-left: 32px }}
-  .workflow::before {{
+  .workflow { position: relative; padding-left: 32px }
+  .workflow::before {
     content: ''; position: absolute;
     left: 10px; top: 0; bottom: 0; width: 2px;
     background: linear-gradient(180deg, #06b6d4 0%, #ec4899 35%, #3b82f6 55%, #10b981 80%, #8b5cf6 100%);
     opacity: 0.2; border-radius: 2px;
-  }}
+  }
 
-  .phase-label {{
+  .phase-label {
     position: relative;
     font-family: var(--font-mono);
     font-size: 0.75rem; font-weight: 500;
@@ -1105,207 +991,210 @@ def generate_html(config, marketing=False):
     color: var(--phase-color, var(--text-dim));
     padding: 22px 0 12px;
     display: flex; align-items: center; gap: 10px;
-  }}
-  .phase-label::before {{
+  }
+  .phase-label::before {
     content: ''; position: absolute;
     left: -22px; top: 50%; transform: translateY(30%);
     width: 8px; height: 8px; border-radius: 50%;
     background: var(--phase-color, var(--text-dim)); opacity: 0.4;
-  }}
-  .phase-label::after {{
+  }
+  .phase-label::after {
     content: ''; flex: 1; height: 1px;
     background: linear-gradient(90deg, var(--phase-color, var(--border)), transparent);
     opacity: 0.2;
-  }}
+  }
 
-  .step-card {{
+  .step-card {
     background: var(--card); border: 1px solid var(--border);
     border-radius: 10px; padding: 18px 22px;
     margin-bottom: 10px; cursor: pointer;
     transition: all 0.25s var(--ease); position: relative;
-  }}
-  .step-card:hover {{
+    contain: layout; /* not paint: the timeline dot sits outside the card */
+  }
+  .step-card:hover {
     border-color: var(--border-light); background: var(--card-hover);
     transform: translateX(3px);
-  }}
-  .step-card::before {{
+  }
+  .step-card::before {
     content: ''; position: absolute;
     left: -26px; top: 20px;
     width: 6px; height: 6px; border-radius: 50%;
     background: var(--border-light); transition: background 0.2s;
-  }}
-  .step-card:hover::before {{ background: var(--text-secondary) }}
+  }
+  .step-card:hover::before { background: var(--text-secondary) }
 
-  .step-header {{ display: flex; align-items: baseline; gap: 10px; margin-bottom: 2px }}
-  .step-skill {{ font-family: var(--font-mono); font-size: 0.9rem; font-weight: 600; color: var(--text) }}
-  .step-desc {{ font-size: 0.82rem; color: var(--text-secondary) }}
+  .step-header { display: flex; align-items: baseline; gap: 10px; margin-bottom: 2px }
+  .step-skill { font-family: var(--font-mono); font-size: 0.9rem; font-weight: 600; color: var(--text) }
+  .step-desc { font-size: 0.82rem; color: var(--text-secondary) }
 
-  .step-agents {{ margin-top: 10px; padding-top: 10px; border-top: 1px solid var(--border) }}
-  .step-agent-row {{
+  .step-agents { margin-top: 10px; padding-top: 10px; border-top: 1px solid var(--border) }
+  .step-agent-row {
     display: flex; align-items: baseline; gap: 10px;
     padding: 5px 0; font-size: 0.82rem;
-  }}
-  .step-agent-chip {{
+  }
+  .step-agent-chip {
     display: inline-flex; align-items: center; gap: 5px;
     width: var(--chip-w); flex-shrink: 0;
     font-family: var(--font-mono); font-size: 0.78rem; font-weight: 500;
     color: var(--agent-color);
-  }}
-  .step-agent-chip .cdot {{ width: 5px; height: 5px; border-radius: 50%; background: var(--agent-color) }}
-  .step-agent-role {{ color: var(--text-secondary); font-size: 0.82rem; line-height: 1.5 }}
+  }
+  .step-agent-chip .cdot { width: 5px; height: 5px; border-radius: 50%; background: var(--agent-color) }
+  .step-agent-role { color: var(--text-secondary); font-size: 0.82rem; line-height: 1.5 }
 
   /* Sprint branch */
-  .sprint-branch {{
+  .sprint-branch {
     background: var(--surface); border: 2px dashed var(--border);
     border-radius: 12px; padding: 18px 20px;
-    margin: 12px 0; position: relative;
-  }}
-  .sprint-branch::before {{
+    margin: 12px 0; position: relative; cursor: pointer;
+  }
+  .sprint-branch::before {
     content: ''; position: absolute;
     left: -26px; top: 24px;
     width: 6px; height: 6px; border-radius: 50%;
     background: var(--border-light);
-  }}
-  .sprint-or {{
+  }
+  .sprint-or {
     font-family: var(--font-mono);
     font-size: 0.75rem; font-weight: 500;
     letter-spacing: 0.08em; text-transform: uppercase;
     color: var(--text-dim);
     display: flex; align-items: center; gap: 10px;
     margin-bottom: 10px;
-  }}
-  .sprint-or::before, .sprint-or::after {{
+  }
+  .sprint-or::before, .sprint-or::after {
     content: ''; flex: 1; height: 1px;
     background: var(--border);
-  }}
-  .sprint-header {{
+  }
+  .sprint-header {
     font-family: var(--font-mono); font-size: 0.9rem; font-weight: 600;
     color: var(--text); margin-bottom: 2px;
-  }}
-  .sprint-desc {{ font-size: 0.82rem; color: var(--text-secondary); margin-bottom: 10px; line-height: 1.5 }}
+  }
+  .sprint-desc { font-size: 0.82rem; color: var(--text-secondary); margin-bottom: 10px; line-height: 1.5 }
 
   /* ════ VALUE PROP CARDS ════ */
-  .vp-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 14px }}
-  @media (max-width: 540px) {{ .vp-grid {{ grid-template-columns: 1fr }} }}
+  .vp-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 14px }
+  @media (max-width: 540px) { .vp-grid { grid-template-columns: 1fr } }
 
-  .vp-card {{
+  .vp-card {
     background: var(--card); border: 1px solid var(--border);
     border-radius: 10px; padding: 18px 20px;
-    cursor: pointer; transition: all 0.25s var(--ease);
-  }}
-  .vp-card:hover {{ border-color: var(--border-light); background: var(--card-hover) }}
-  .vp-icon {{ font-size: 1.3rem; margin-bottom: 8px }}
-  .vp-name {{
+    cursor: pointer; transition: all 0.25s var(--ease); contain: layout paint;
+  }
+  .vp-card:hover { border-color: var(--border-light); background: var(--card-hover) }
+  .vp-icon { font-size: 1.3rem; margin-bottom: 8px }
+  .vp-name {
     font-family: var(--font-mono); font-size: 0.85rem; font-weight: 600;
     color: var(--text); margin-bottom: 4px;
-  }}
-  .vp-desc {{ font-size: 0.82rem; color: var(--text-secondary); line-height: 1.55 }}
-  .vp-agents {{ display: flex; flex-wrap: wrap; gap: 6px; margin-top: 8px }}
-  .vp-chip {{
+  }
+  .vp-desc { font-size: 0.82rem; color: var(--text-secondary); line-height: 1.55 }
+  .vp-agents { display: flex; flex-wrap: wrap; gap: 6px; margin-top: 8px }
+  .vp-chip {
     display: inline-flex; align-items: center; gap: 4px;
     font-family: var(--font-mono); font-size: 0.75rem; font-weight: 500;
     padding: 3px 9px; border-radius: 4px;
     background: rgba(255,255,255,0.03); color: var(--chip-color, var(--text-dim));
-  }}
-  .vp-chip .cdot {{ width: 4px; height: 4px; border-radius: 50%; background: var(--chip-color, var(--text-dim)) }}
+  }
+  .vp-chip .cdot { width: 4px; height: 4px; border-radius: 50%; background: var(--chip-color, var(--text-dim)) }
 
   /* ════ TEAMS ════ */
-  .team-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 14px }}
-  @media (max-width: 600px) {{ .team-grid {{ grid-template-columns: 1fr }} }}
+  .team-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 14px }
+  @media (max-width: 600px) { .team-grid { grid-template-columns: 1fr } }
 
-  .team-card {{
+  .team-card {
     background: transparent; border: 1px dashed var(--border);
     border-radius: 10px; padding: 18px 20px;
-    cursor: pointer; transition: all 0.25s var(--ease);
-  }}
-  .team-card:hover {{ border-color: var(--border-light); border-style: solid; background: var(--card) }}
-  .team-name {{ font-weight: 600; font-size: 0.88rem; margin-bottom: 4px }}
-  .team-purpose {{ font-size: 0.82rem; color: var(--text-secondary); margin-bottom: 10px; line-height: 1.55 }}
-  .team-members {{ display: flex; flex-wrap: wrap; gap: 6px }}
-  .team-member {{
+    cursor: pointer; transition: all 0.25s var(--ease); contain: layout paint;
+  }
+  .team-card:hover { border-color: var(--border-light); border-style: solid; background: var(--card) }
+  .team-name { font-weight: 600; font-size: 0.88rem; margin-bottom: 4px }
+  .team-purpose { font-size: 0.82rem; color: var(--text-secondary); margin-bottom: 10px; line-height: 1.55 }
+  .team-members { display: flex; flex-wrap: wrap; gap: 6px }
+  .team-member {
     display: inline-flex; align-items: center; gap: 4px;
     font-size: 0.78rem; font-weight: 500;
     padding: 3px 10px 3px 8px; border-radius: 5px;
     background: rgba(255,255,255,0.03); color: var(--member-color);
-  }}
-  .team-member .cdot {{ width: 5px; height: 5px; border-radius: 50%; background: var(--member-color) }}
+  }
+  .team-member .cdot { width: 5px; height: 5px; border-radius: 50%; background: var(--member-color) }
 
   /* ════ FOOTER ════ */
-  .footer {{
+  .footer {
     text-align: center; padding: 48px 0 0; margin-top: 24px; position: relative;
-  }}
-  .footer::before {{
+  }
+  .footer::before {
     content: ''; position: absolute; top: 0; left: 0; right: 0; height: 1px;
     background: linear-gradient(90deg, transparent, var(--border), transparent);
-  }}
-  .footer-name {{ font-size: 0.85rem; color: var(--text-secondary); margin-bottom: 8px }}
-  .footer-links {{ display: flex; gap: 20px; justify-content: center; font-size: 0.82rem; flex-wrap: wrap }}
-  .footer-links a {{ color: var(--text-dim); text-decoration: none; transition: color 0.2s }}
-  .footer-links a:hover {{ color: var(--text-secondary) }}
+  }
+  .footer-name { font-size: 0.85rem; color: var(--text-secondary); margin-bottom: 8px }
+  .footer-links { display: flex; gap: 20px; justify-content: center; font-size: 0.82rem; flex-wrap: wrap }
+  .footer-links a { color: var(--text-dim); text-decoration: none; transition: color 0.2s }
+  .footer-links a:hover { color: var(--text-secondary) }
 
   /* ════ DETAIL PANEL ════ */
-  .panel-scrim {{
+  .panel-scrim {
     position: fixed; inset: 0; background: rgba(0,0,0,0.5);
     opacity: 0; pointer-events: none; transition: opacity 0.25s var(--ease); z-index: 100;
-  }}
-  .panel-scrim.open {{ opacity: 1; pointer-events: auto }}
-  .panel {{
+  }
+  .panel-scrim.open { opacity: 1; pointer-events: auto }
+  .panel {
     position: fixed; top: 0; right: 0;
     width: min(420px, 90vw); height: 100vh;
     background: var(--surface); border-left: 1px solid var(--border);
     transform: translateX(100%); transition: transform 0.3s var(--ease);
     z-index: 101; display: flex; flex-direction: column;
     box-shadow: -8px 0 40px rgba(0,0,0,0.4);
-  }}
-  .panel.open {{ transform: translateX(0) }}
-  .panel-header {{
+  }
+  .panel.open { transform: translateX(0) }
+  .panel-header {
     display: flex; align-items: center; justify-content: space-between;
     padding: 18px 20px; border-bottom: 1px solid var(--border); flex-shrink: 0;
-  }}
-  .panel-header-left {{ display: flex; align-items: center; gap: 10px }}
-  .panel-type-badge {{
+  }
+  .panel-header-left { display: flex; align-items: center; gap: 10px }
+  .panel-type-badge {
     font-family: var(--font-mono); font-size: 0.75rem; font-weight: 600;
     letter-spacing: 0.06em; text-transform: uppercase; padding: 4px 9px; border-radius: 4px;
-  }}
-  .panel-type-agent {{ background: rgba(59,130,246,0.12); color: #60a5fa }}
-  .panel-type-skill {{ background: rgba(139,92,246,0.12); color: #a78bfa }}
-  .panel-type-team {{ background: rgba(129,140,248,0.12); color: #a5b4fc }}
-  .panel-title-text {{ font-weight: 600; font-size: 1.05rem }}
-  .panel-close {{
+  }
+  .panel-type-agent { background: rgba(59,130,246,0.12); color: #60a5fa }
+  .panel-type-skill { background: rgba(139,92,246,0.12); color: #a78bfa }
+  .panel-type-team { background: rgba(129,140,248,0.12); color: #a5b4fc }
+  .panel-title-text { font-weight: 600; font-size: 1.05rem }
+  .panel-close {
     background: none; border: 1px solid var(--border); border-radius: 6px;
     color: var(--text-dim); cursor: pointer; width: 28px; height: 28px;
     display: flex; align-items: center; justify-content: center;
     font-size: 1.1rem; transition: all 0.15s;
-  }}
-  .panel-close:hover {{ border-color: var(--text-secondary); color: var(--text) }}
-  .panel-body {{
+  }
+  .panel-close:hover { border-color: var(--text-secondary); color: var(--text) }
+  .panel-body {
     padding: 20px; overflow-y: auto; flex: 1;
     font-size: 0.88rem; line-height: 1.7; color: var(--text-secondary);
-  }}
-  .panel-meta {{
+  }
+  .panel-meta {
     background: var(--bg); border-radius: 8px; padding: 12px 14px; margin-bottom: 16px;
-  }}
-  .panel-meta-row {{ display: flex; gap: 8px; margin: 4px 0; font-size: 0.82rem; align-items: baseline }}
-  .panel-meta-label {{
+  }
+  .panel-meta-row { display: flex; gap: 8px; margin: 4px 0; font-size: 0.82rem; align-items: baseline }
+  .panel-invoke { font-family: var(--font-mono); font-size: 0.82rem; color: #a78bfa }
+  .panel-meta-label {
     font-family: var(--font-mono); font-size: 0.75rem; font-weight: 600;
     letter-spacing: 0.08em; text-transform: uppercase;
     color: var(--text-dim); width: 62px; flex-shrink: 0;
-  }}
-  .panel-section-title {{
+  }
+  .panel-section-title {
     font-family: var(--font-mono); font-size: 0.75rem; font-weight: 600;
     letter-spacing: 0.1em; text-transform: uppercase;
     color: var(--text-dim); margin: 16px 0 8px;
-  }}
-  .panel-skill-item {{ padding: 6px 0; border-bottom: 1px solid var(--border); font-size: 0.84rem }}
-  .panel-skill-item:last-child {{ border-bottom: none }}
-  .panel-skill-name {{ font-family: var(--font-mono); font-weight: 600; color: var(--text); font-size: 0.82rem }}
-  .panel-skill-role {{ color: var(--text-secondary); font-size: 0.8rem }}
+  }
+  .panel-skill-item { padding: 6px 0; border-bottom: 1px solid var(--border); font-size: 0.84rem }
+  .panel-skill-item:last-child { border-bottom: none }
+  .panel-skill-name { font-family: var(--font-mono); font-weight: 600; color: var(--text); font-size: 0.82rem }
+  .panel-skill-role { color: var(--text-secondary); font-size: 0.8rem }
+  $highlight_css
 </style>
 </head>
 <body>
 <div class="page" id="page">
 
-  {hero_html}
+  $hero_html
 
   <!-- How it works -->
   <div class="section">
@@ -1318,7 +1207,7 @@ def generate_html(config, marketing=False):
       <div class="hiw-node hiw-claude"><span class="hiw-label">Claude</span>Orchestrator</div>
       <span class="hiw-arrow">&rarr;</span>
       <div class="hiw-agents-node">
-        {hiw_dots}
+        $hiw_dots
       </div>
     </div>
   </div>
@@ -1326,17 +1215,17 @@ def generate_html(config, marketing=False):
   <!-- Your AI team -->
   <div class="section" id="team-section">
     <div class="section-eyebrow reveal">Your AI team</div>
-    <div class="section-heading reveal">{len(agents)} specialized agent{"s" if len(agents) != 1 else ""}</div>
+    <div class="section-heading reveal">$agent_count specialized agent$agent_plural</div>
     <div class="section-desc reveal">Each agent brings deep expertise. Hover to see where they contribute across the workflow.</div>
-    <div class="agent-grid" id="agent-grid"></div>
+    <div class="agent-grid" id="agent-grid">$agent_cards_html</div>
   </div>
 
   <!-- The workflow -->
   <div class="section" id="workflow-section">
     <div class="section-eyebrow reveal">The workflow</div>
-    <div class="section-heading reveal">Idea to launch in {len(lifecycle)} steps</div>
+    <div class="section-heading reveal">Idea to launch in $step_count steps</div>
     <div class="section-desc reveal">A guided lifecycle from research through release. Each step knows who to call and what they should do.</div>
-    <div class="workflow" id="workflow"></div>
+    <div class="workflow" id="workflow">$workflow_html</div>
   </div>
 
   <!-- Agent teams -->
@@ -1344,12 +1233,12 @@ def generate_html(config, marketing=False):
     <div class="section-eyebrow reveal">Agent teams</div>
     <div class="section-heading reveal">Collaborative meetings</div>
     <div class="section-desc reveal">Pre-configured teams for common workflows via <code style="font-family:var(--font-mono);color:#a78bfa">/kickoff</code>. You can also assemble ad-hoc teams by naming any agents.</div>
-    <div class="team-grid" id="team-grid"></div>
+    <div class="team-grid" id="team-grid">$team_cards_html</div>
   </div>
 
-  {beyond_section_html}
+  $beyond_section_html
 
-  {footer_html}
+  $footer_html
 </div>
 
 <!-- Detail panel -->
@@ -1365,167 +1254,58 @@ def generate_html(config, marketing=False):
   <div class="panel-body" id="panelBody"></div>
 </div>
 
+<script type="application/json" id="page-data">$data_json</script>
 <script>
 // ════════════════════════
-// DATA (injected from Python)
-// ════════════════════════
-const AGENTS = {agents_json};
-const LIFECYCLE = {lifecycle_json};
-const PHASES = {phases_json};
-const VP_CARDS = {vp_json};
-const TEAMS = {teams_json};
-const DETAIL_DATA = {detail_json};
-const SPRINT = {sprint_json};
-const COLOR_MAP = {color_map_json};
-
-const AM = {{}};
-AGENTS.forEach(a => AM[a.id] = a);
-
-// ════════════════════════
-// RENDER
+// DATA (injected from Python as a JSON island; JSON.parse beats compiling a literal)
 // ════════════════════════
-
-// Agents
-const agentGrid = document.getElementById('agent-grid');
-AGENTS.forEach(a => {{
-  const d = document.createElement('div');
-  d.className = 'agent-card dimmable reveal';
-  d.dataset.agent = a.id;
-  d.style.setProperty('--agent-color', a.color);
-  d.innerHTML = '<div class="agent-top"><span class="agent-dot"></span><span class="agent-name">' + a.name + '</span></div><div class="agent-role">' + a.desc + '</div>';
-  d.addEventListener('click', () => openAgentPanel(a.id));
-  d.addEventListener('mouseenter', () => hlAgent(a.id));
-  d.addEventListener('mouseleave', clearHl);
-  agentGrid.appendChild(d);
-}});
-
-// Workflow
-const wf = document.getElementById('workflow');
-let curPhase = -1;
-LIFECYCLE.forEach((step, i) => {{
-  if (step.phase !== curPhase) {{
-    curPhase = step.phase;
-    const ph = document.createElement('div');
-    ph.className = 'phase-label reveal';
-    const phDef = PHASES[step.phase] || {{ label: 'Phase ' + step.phase, color: '#94a3b8' }};
-    ph.style.setProperty('--phase-color', phDef.color);
-    ph.textContent = phDef.label;
-    wf.appendChild(ph);
-  }}
-  const card = document.createElement('div');
-  card.className = 'step-card dimmable reveal';
-  card.dataset.skill = step.skill;
-  step.agents.forEach(sa => card.setAttribute('data-agent-' + sa.id, '1'));
-
-  const agHtml = step.agents.map(sa => {{
-    return '<div class="step-agent-row"><span class="step-agent-chip" style="--agent-color:' + sa.color + '"><span class="cdot"></span>' + sa.name + '</span><span class="step-agent-role">' + sa.role + '</span></div>';
-  }}).join('');
-
-  card.innerHTML = '<div class="step-header"><span class="step-skill">/' + step.skill + '</span><span class="step-desc">' + step.desc + '</span></div>' + (agHtml ? '<div class="step-agents">' + agHtml + '</div>' : '');
-  card.addEventListener('click', () => openSkillPanel(step.skill));
-  card.addEventListener('mouseenter', () => hlSkill(step.skill));
-  card.addEventListener('mouseleave', clearHl);
-  wf.appendChild(card);
-
-  // Sprint branch after /build
-  if (step.skill === 'build' && SPRINT) {{
-    const branch = document.createElement('div');
-    branch.className = 'sprint-branch dimmable reveal';
-    branch.dataset.skill = 'sprint';
-    // Figure out sprint agents from data
-    const sprintAgentIds = ['engineer','qa','designer'].filter(id => AM[id]);
-    sprintAgentIds.forEach(id => branch.setAttribute('data-agent-' + id, '1'));
-
-    let sprintAgentHtml = '';
-    sprintAgentIds.forEach(id => {{
-      const ag = AM[id];
-      if (ag) {{
-        sprintAgentHtml += '<div class="step-agent-row"><span class="step-agent-chip" style="--agent-color:' + ag.color + '"><span class="cdot"></span>' + ag.name + '</span><span class="step-agent-role">' + ag.desc + '</span></div>';
-      }}
-    }});
-
-    branch.innerHTML = '<div class="sprint-or">or batch-execute with</div>' +
-      '<div class="sprint-header">/sprint</div>' +
-      '<div class="sprint-desc">' + (SPRINT.description || 'Batch-execute multiple tickets in parallel') + '</div>' +
-      (sprintAgentHtml ? '<div class="step-agents" style="border:0;padding:0;margin:0">' + sprintAgentHtml + '</div>' : '');
-    branch.style.cursor = 'pointer';
-    branch.addEventListener('click', () => openVpPanel('sprint'));
-    branch.addEventListener('mouseenter', () => hlSkill('sprint'));
-    branch.addEventListener('mouseleave', clearHl);
-    wf.appendChild(branch);
-  }}
-}});
-
-// Value prop cards
-const vpGrid = document.getElementById('vp-grid');
-if (vpGrid) VP_CARDS.forEach(vp => {{
-  const d = document.createElement('div');
-  d.className = 'vp-card reveal';
-  d.dataset.skill = vp.skill;
-
-  const chips = vp.agents.map(id => {{
-    if (id === 'orchestrator') return '<span class="vp-chip" style="--chip-color:var(--orchestrator)"><span class="cdot"></span>Orchestrator</span>';
-    const ag = AM[id];
-    if (!ag) {{
-      // Try matching by name
-      const found = AGENTS.find(a => a.name.toLowerCase().replace(/\\s+/g,'-') === id || a.name.toLowerCase() === id);
-      if (found) return '<span class="vp-chip" style="--chip-color:' + found.color + '"><span class="cdot"></span>' + found.name + '</span>';
-      return '<span class="vp-chip" style="--chip-color:var(--orchestrator)"><span class="cdot"></span>' + id + '</span>';
-    }}
-    return '<span class="vp-chip" style="--chip-color:' + ag.color + '"><span class="cdot"></span>' + ag.name + '</span>';
-  }}).join('');
-
-  d.innerHTML = '<div class="vp-icon">' + vp.icon + '</div><div class="vp-name">' + vp.name + '</div><div class="vp-desc">' + vp.desc + '</div><div class="vp-agents">' + chips + '</div>';
-  d.addEventListener('click', () => openVpPanel(vp.skill));
-  vpGrid.appendChild(d);
-}});
-
-// Teams
-const teamGrid = document.getElementById('team-grid');
-TEAMS.forEach((t, i) => {{
-  const d = document.createElement('div');
-  d.className = 'team-card dimmable reveal';
-  d.dataset.team = i;
-  t.members.forEach(m => d.setAttribute('data-agent-' + m.id, '1'));
-  const mHtml = t.members.map(m => {{
-    return '<span class="team-member" style="--member-color:' + m.color + '"><span class="cdot"></span>' + m.name + '</span>';
-  }}).join('');
-  d.innerHTML = '<div class="team-name">' + t.name + '</div><div class="team-purpose">' + (t.purpose || '') + '</div><div class="team-members">' + mHtml + '</div>';
-  d.addEventListener('click', () => openTeamPanel(i));
-  d.addEventListener('mouseenter', () => hlTeam(i));
-  d.addEventListener('mouseleave', clearHl);
-  teamGrid.appendChild(d);
-}});
+const DATA = JSON.parse(document.getElementById('page-data').textContent);
+const { AGENTS, LIFECYCLE, PHASES, VP_CARDS, TEAMS, DETAIL_DATA } = DATA;
+
+// Lookups keyed by plugin-provided strings are Maps: a plain object would
+// answer ids like "constructor" from its prototype.
+const AM = new Map(AGENTS.map(a => [a.id, a]));
+
+// Reverse indexes for the detail panels, built once instead of per open
+const STEP_BY_SKILL = new Map(), VP_BY_SKILL = new Map(), AGENT_STEPS = new Map(), AGENT_TEAMS = new Map();
+function first(map, k, v) { if (!map.has(k)) map.set(k, v) }
+function group(map, k, v) { const l = map.get(k); if (l) l.push(v); else map.set(k, [v]) }
+LIFECYCLE.forEach(s => {
+  first(STEP_BY_SKILL, s.skill, s);
+  const seen = new Set();
+  s.agents.forEach(sa => {
+    if (!seen.has(sa.id)) { seen.add(sa.id); group(AGENT_STEPS, sa.id, { skill: s.skill, role: sa.role }); }
+  });
+});
+VP_CARDS.forEach(v => first(VP_BY_SKILL, v.skill, v));
+TEAMS.forEach(t => new Set(t.members.map(m => m.id)).forEach(id => group(AGENT_TEAMS, id, t)));
+
+// Cards are rendered by Python. Each carries data-panel (click), and the
+// hoverable ones data-key (hover) and data-rel (hover keys that light it up).
+const page = document.getElementById('page');
 
 // ════════════════════════
 // HIGHLIGHTING
 // ════════════════════════
-function hlAgent(id) {{
-  document.getElementById('page').classList.add('filtering');
-  document.querySelectorAll('[data-agent="' + id + '"]').forEach(el => el.classList.add('hl'));
-  document.querySelectorAll('[data-agent-' + id + ']').forEach(el => el.classList.add('hl'));
-}}
-function hlSkill(sk) {{
-  document.getElementById('page').classList.add('filtering');
-  document.querySelectorAll('[data-skill="' + sk + '"]').forEach(el => el.classList.add('hl'));
-  const step = LIFECYCLE.find(s => s.skill === sk);
-  if (step) step.agents.forEach(sa => document.querySelectorAll('[data-agent="' + sa.id + '"]').forEach(el => el.classList.add('hl')));
-  if (sk === 'sprint') {{
-    ['engineer','qa','designer'].forEach(id => document.querySelectorAll('[data-agent="' + id + '"]').forEach(el => el.classList.add('hl')));
-  }}
-}}
-function hlTeam(idx) {{
-  document.getElementById('page').classList.add('filtering');
-  document.querySelectorAll('[data-team="' + idx + '"]').forEach(el => el.classList.add('hl'));
-  TEAMS[idx].members.forEach(m => {{
-    document.querySelectorAll('[data-agent="' + m.id + '"]').forEach(el => el.classList.add('hl'));
-    document.querySelectorAll('[data-agent-' + m.id + ']').forEach(el => el.classList.add('hl'));
-  }});
-}}
-function clearHl() {{
-  document.getElementById('page').classList.remove('filtering');
-  document.querySelectorAll('.hl').forEach(el => el.classList.remove('hl'));
-}}
+// Hovering writes a single data-hl attribute on #page. One generated rule per
+// hover key (in the <style> block) un-dims the cards whose data-rel names it,
+// so a hover costs one attribute write instead of a classList toggle per card.
+function hl(key) { page.dataset.hl = key }
+function clearHl() { page.removeAttribute('data-hl') }
+
+// Delegated hover: mouseover/mouseout bubble, so one pair of listeners covers
+// every card. Moves between a card's own children are ignored.
+function hoverCard(ev) {
+  const card = ev.target.closest('[data-key]');
+  return card && !card.contains(ev.relatedTarget) ? card : null;
+}
+page.addEventListener('mouseover', ev => {
+  const card = hoverCard(ev);
+  if (card) hl(card.dataset.key);
+});
+page.addEventListener('mouseout', ev => {
+  if (hoverCard(ev)) clearHl();
+});
 
 // ════════════════════════
 // DETAIL PANEL
@@ -1536,108 +1316,565 @@ const panelBadge = document.getElementById('panelBadge');
 const panelTitle = document.getElementById('panelTitle');
 const panelBody = document.getElementById('panelBody');
 
-function openPanel(type, title, html) {{
+function openPanel(type, title, nodes) {
   panelBadge.textContent = type;
   panelBadge.className = 'panel-type-badge panel-type-' + type;
   panelTitle.textContent = title;
-  panelBody.innerHTML = html;
+  panelBody.replaceChildren(...nodes);
   panel.classList.add('open');
   panelScrim.classList.add('open');
-}}
-function closePanel() {{ panel.classList.remove('open'); panelScrim.classList.remove('open') }}
+}
+function closePanel() { panel.classList.remove('open'); panelScrim.classList.remove('open') }
 document.getElementById('panelClose').addEventListener('click', closePanel);
 panelScrim.addEventListener('click', closePanel);
-document.addEventListener('keydown', ev => {{ if (ev.key === 'Escape') closePanel() }});
+document.addEventListener('keydown', ev => { if (ev.key === 'Escape') closePanel() });
+
+// Panel contents never change after render, so each one is built on first open only
+const panelCache = {};
+function showPanel(key, build) {
+  const p = key in panelCache ? panelCache[key] : (panelCache[key] = build());
+  if (p) openPanel(p.type, p.title, p.nodes);
+}
+const PANEL_BUILDERS = { agent: agentPanel, skill: skillPanel, vp: vpPanel, team: teamPanel };
+page.addEventListener('click', ev => {
+  const card = ev.target.closest('[data-panel]');
+  if (!card) return;
+  const key = card.dataset.panel, sep = key.indexOf('-');
+  showPanel(key, () => PANEL_BUILDERS[key.slice(0, sep)](key.slice(sep + 1)));
+});
+
+// Panel bodies are built as nodes with text children, so data strings are never
+// parsed as HTML. Cached nodes are simply re-attached on the next open.
+function el(tag, cls, ...kids) {
+  const n = document.createElement(tag);
+  if (cls) n.className = cls;
+  n.append(...kids);
+  return n;
+}
+function metaRow(label, ...value) {
+  return el('div', 'panel-meta-row', el('span', 'panel-meta-label', label), ...value);
+}
+function panelItem(name, role, color) {
+  const n = el('span', 'panel-skill-name', name);
+  if (color) n.style.color = color;
+  return el('div', 'panel-skill-item', n, el('div', 'panel-skill-role', role));
+}
 
-function openAgentPanel(id) {{
-  const a = AM[id]; if (!a) return;
+function agentPanel(id) {
+  const a = AM.get(id); if (!a) return;
   const dd = DETAIL_DATA['agent-' + id];
-  const lSkills = LIFECYCLE.filter(s => s.agents.some(sa => sa.id === id));
-  const aTeams = TEAMS.filter(t => t.members.some(m => m.id === id));
+  const lSkills = AGENT_STEPS.get(id) || [];
+  const aTeams = AGENT_TEAMS.get(id) || [];
   const modelVal = a.model || 'inherit';
-  const modelHtml = (modelVal && modelVal !== 'inherit' && modelVal !== 'null')
-    ? '<span class="panel-model-badge panel-model-explicit">Claude ' + modelVal.charAt(0).toUpperCase() + modelVal.slice(1) + '</span>'
-    : '<span class="panel-model-badge panel-model-inherit">Inherits from conversation</span>';
-  let h = '<div class="panel-meta">' +
-    '<div class="panel-meta-row"><span class="panel-meta-label">Model</span>' + modelHtml + '</div>' +
-    '<div class="panel-meta-row"><span class="panel-meta-label">Role</span>' + (dd ? dd.desc : a.desc) + '</div>';
-  if (a.tools && a.tools.length) h += '<div class="panel-meta-row"><span class="panel-meta-label">Tools</span>' + a.tools.join(', ') + '</div>';
-  if (aTeams.length) h += '<div class="panel-meta-row"><span class="panel-meta-label">Teams</span>' + aTeams.map(t=>t.name).join(', ') + '</div>';
-  h += '</div>';
-  if (lSkills.length) {{
-    h += '<div class="panel-section-title">Lifecycle roles</div>';
-    lSkills.forEach(s => {{
-      const r = s.agents.find(sa => sa.id === id);
-      h += '<div class="panel-skill-item"><span class="panel-skill-name">/' + s.skill + '</span><div class="panel-skill-role">' + (r ? r.role : '') + '</div></div>';
-    }});
-  }}
-  openPanel('agent', a.name, h);
-}}
-
-function openSkillPanel(sk) {{
-  const step = LIFECYCLE.find(s => s.skill === sk); if (!step) return;
-  const phDef = PHASES[step.phase] || {{ label: '', color: '#94a3b8' }};
-  let h = '<div class="panel-meta"><div class="panel-meta-row"><span class="panel-meta-label">Phase</span>' + phDef.label + '</div><div class="panel-meta-row"><span class="panel-meta-label">Purpose</span>' + step.desc + '</div></div>';
-  if (step.agents.length) {{
-    h += '<div class="panel-section-title">Agents involved</div>';
-    step.agents.forEach(sa => {{
-      h += '<div class="panel-skill-item"><span class="panel-skill-name" style="color:' + sa.color + '">' + sa.name + '</span><div class="panel-skill-role">' + sa.role + '</div></div>';
-    }});
-  }}
-  openPanel('skill', '/' + sk, h);
-}}
-
-function openVpPanel(sk) {{
-  const vp = VP_CARDS.find(v => v.skill === sk); if (!vp) return;
-  const agentNames = vp.agents.map(id => {{
+  const model = (modelVal && modelVal !== 'inherit' && modelVal !== 'null')
+    ? el('span', 'panel-model-badge panel-model-explicit', 'Claude ' + modelVal.charAt(0).toUpperCase() + modelVal.slice(1))
+    : el('span', 'panel-model-badge panel-model-inherit', 'Inherits from conversation');
+  const meta = el('div', 'panel-meta', metaRow('Model', model), metaRow('Role', dd ? dd.desc : a.desc));
+  if (a.tools && a.tools.length) meta.append(metaRow('Tools', a.tools.join(', ')));
+  if (aTeams.length) meta.append(metaRow('Teams', aTeams.map(t=>t.name).join(', ')));
+  const nodes = [meta];
+  if (lSkills.length) {
+    nodes.push(el('div', 'panel-section-title', 'Lifecycle roles'));
+    lSkills.forEach(s => nodes.push(panelItem('/' + s.skill, s.role)));
+  }
+  return { type: 'agent', title: a.name, nodes };
+}
+
+function skillPanel(sk) {
+  const step = STEP_BY_SKILL.get(sk); if (!step) return;
+  const phDef = PHASES[step.phase] || { label: '', color: '#94a3b8' };
+  const nodes = [el('div', 'panel-meta', metaRow('Phase', phDef.label), metaRow('Purpose', step.desc))];
+  if (step.agents.length) {
+    nodes.push(el('div', 'panel-section-title', 'Agents involved'));
+    step.agents.forEach(sa => nodes.push(panelItem(sa.name, sa.role, sa.color)));
+  }
+  return { type: 'skill', title: '/' + sk, nodes };
+}
+
+function vpPanel(sk) {
+  const vp = VP_BY_SKILL.get(sk); if (!vp) return;
+  const agentNames = vp.agents.map(id => {
     if (id === 'orchestrator') return 'Orchestrator (Claude)';
-    const ag = AM[id];
+    const ag = AM.get(id);
     return ag ? ag.name : id;
-  }});
-  let h = '<div class="panel-meta"><div class="panel-meta-row"><span class="panel-meta-label">Type</span>Utility Skill</div><div class="panel-meta-row"><span class="panel-meta-label">Purpose</span>' + vp.desc + '</div><div class="panel-meta-row"><span class="panel-meta-label">Agents</span>' + agentNames.join(', ') + '</div></div>';
-  openPanel('skill', vp.name, h);
-}}
+  });
+  const meta = el('div', 'panel-meta', metaRow('Type', 'Utility Skill'), metaRow('Purpose', vp.desc), metaRow('Agents', agentNames.join(', ')));
+  return { type: 'skill', title: vp.name, nodes: [meta] };
+}
 
-function openTeamPanel(idx) {{
+function teamPanel(idx) {
   const t = TEAMS[idx]; if (!t) return;
-  let h = '<div class="panel-meta"><div class="panel-meta-row"><span class="panel-meta-label">Purpose</span>' + (t.purpose || '') + '</div><div class="panel-meta-row"><span class="panel-meta-label">Invoke</span><code style="font-family:var(--font-mono);font-size:0.82rem;color:#a78bfa">/kickoff ' + t.name.toLowerCase() + '</code></div></div>';
-  h += '<div class="panel-section-title">Members</div>';
-  t.members.forEach(m => {{
-    h += '<div class="panel-skill-item"><span class="panel-skill-name" style="color:' + m.color + '">' + m.name + '</span><div class="panel-skill-role">' + (AM[m.id] ? AM[m.id].desc : '') + '</div></div>';
-  }});
-  openPanel('team', t.name, h);
-}}
+  const meta = el('div', 'panel-meta', metaRow('Purpose', t.purpose || ''), metaRow('Invoke', el('code', 'panel-invoke', '/kickoff ' + t.name.toLowerCase())));
+  const nodes = [meta, el('div', 'panel-section-title', 'Members')];
+  t.members.forEach(m => nodes.push(panelItem(m.name, AM.has(m.id) ? AM.get(m.id).desc : '', m.color)));
+  return { type: 'team', title: t.name, nodes };
+}
 
 // ════════════════════════
 // COPY
 // ════════════════════════
-function copyCmd(id, btn) {{
-  navigator.clipboard.writeText(document.getElementById(id).textContent).then(() => {{
+function copyCmd(btn) {
+  navigator.clipboard.writeText(btn.dataset.cmd).then(() => {
     btn.classList.add('copied');
-    btn.innerHTML = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5"><polyline points="20 6 9 17 4 12"/></svg>';
-    setTimeout(() => {{ btn.classList.remove('copied'); btn.innerHTML = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2"/><path d="M5 15H4a2 2 0 01-2-2V4a2 2 0 012-2h9a2 2 0 012 2v1"/></svg>'; }}, 2000);
-  }});
-}}
+    setTimeout(() => btn.classList.remove('copied'), 2000);
+  });
+}
 
 // ════════════════════════
 // ANIMATIONS
 // ════════════════════════
-const obs = new IntersectionObserver(entries => {{
-  entries.forEach(entry => {{
-    if (entry.isIntersecting) {{
-      const parent = entry.target.parentElement;
-      const siblings = Array.from(parent.querySelectorAll(':scope > .reveal'));
-      const idx = siblings.indexOf(entry.target);
-      setTimeout(() => entry.target.classList.add('visible'), Math.max(0, idx) * 50);
-      obs.unobserve(entry.target);
-    }}
-  }});
-}}, {{ threshold: 0.05, rootMargin: '0px 0px -10px 0px' }});
-document.querySelectorAll('.reveal').forEach(el => obs.observe(el));
-setTimeout(() => document.querySelectorAll('.reveal:not(.visible)').forEach(el => el.classList.add('visible')), 2000);
+// Siblings reveal in a 50ms cascade. Each element's position among its parent's
+// .reveal children is counted once up front and applied as a transition-delay,
+// so a batch of entries is revealed in one frame with no timer per element.
+const REVEAL_MS = 500;  // the .reveal transition duration
+const revealIdx = new Map(), revealCount = new Map();
+let pending = 0;
+const obs = new IntersectionObserver(entries => {
+  const batch = entries.filter(entry => entry.isIntersecting).map(entry => entry.target);
+  if (!batch.length) return;
+  batch.forEach(el => obs.unobserve(el));
+  requestAnimationFrame(() => revealBatch(batch, true));
+}, { threshold: 0.05, rootMargin: '0px 0px -10px 0px' });
+function revealBatch(els, stagger) {
+  let longest = 0;
+  els.forEach(el => {
+    if (el.classList.contains('visible')) return;
+    const delay = stagger ? revealIdx.get(el) * 50 : 0;
+    if (delay) el.style.transitionDelay = delay + 'ms';
+    longest = Math.max(longest, delay);
+    el.classList.add('visible');
+    if (--pending === 0) obs.disconnect();
+  });
+  // Once the batch has finished, drop the stagger delay (it would also hold back
+  // hover dimming) and release the compositor layers. This runs on a timer
+  // because transitionend never fires for elements in a section that
+  // content-visibility is still skipping.
+  setTimeout(() => els.forEach(el => { el.style.transitionDelay = ''; el.style.willChange = 'auto'; }), longest + REVEAL_MS);
+}
+document.querySelectorAll('.reveal').forEach(el => {
+  const n = revealCount.get(el.parentElement) || 0;
+  revealCount.set(el.parentElement, n + 1);
+  revealIdx.set(el, n);
+  pending++;
+  obs.observe(el);
+});
+// Anything still hidden after 2s is shown at once, without the cascade
+setTimeout(() => revealBatch(document.querySelectorAll('.reveal:not(.visible)'), false), 2000);
 </script>
 </body>
-</html>"""
+</html>"""))
+
+
+def generate_html(config, marketing=False):
+    """Generate a self-contained HTML org chart matching the dark-theme design."""
+    name = config.get("name", "My AI Org")
+    agents = config.get("agents", [])
+    skills = config.get("skills", [])
+    teams = config.get("teams", [])
+    lifecycle = config.get("lifecycle", [])
+    alternate_paths = config.get("alternate_paths", [])
+    utility_skills = config.get("utility_skills", [])
+
+    # -- Build data structures --
+    color_map = assign_agent_colors(agents)
+    lifecycle_steps, sprint_alt = build_lifecycle_data(
+        lifecycle, agents, skills, alternate_paths, color_map
+    )
+
+    # Build JS-consumable agent list, plus the agents' detail-panel entries
+    agent_data = []
+    detail_data = {}
+    skill_users = {}  # skill_name -> agent names, in agent order
+    for agent in agents:
+        aid = agent_id(agent["name"])
+        color = color_map.get(agent["name"], FALLBACK_COLOR)
+        model = agent.get("model") or "inherit"
+        detail_desc = agent.get("detail_description", "") or agent.get("description", "")
+        tools = list(agent.get("mcps", []))
+        for ct in agent.get("cli_tools", []):
+            tools.append(f"{ct} CLI")
+        agent_data.append({
+            "id": aid,
+            "name": agent["name"],
+            "color": color,
+            "model": model,
+            "desc": agent.get("description", ""),
+            "tools": tools,
+            "skills": agent.get("skills", []),
+            "knowledge_skills": agent.get("knowledge_skills", []),
+            "mcps": agent.get("mcps", []),
+            "cli_tools": agent.get("cli_tools", []),
+            "detail_description": detail_desc,
+        })
+        detail_data[f"agent-{aid}"] = {
+            "type": "agent",
+            "name": agent["name"],
+            "model": model,
+            "desc": detail_desc,
+            "tools": list(agent.get("mcps", [])) + [f"{t} (CLI)" for t in agent.get("cli_tools", [])],
+            "skills": agent.get("skills", []),
+            "color": color,
+        }
+        for sk_name in set(agent.get("skills", [])):
+            skill_users.setdefault(sk_name, []).append(agent["name"])
+
+    # Sort agents by preferred display order
+    agent_key = _order_key(PREFERRED_AGENT_ORDER)
+    agent_data.sort(key=lambda a: agent_key(a["id"].replace("-", " ")))
+
+    # Build VP cards from utility_skills or alternate_paths
+    vp_cards = []
+    # Always include decision memory (observer) — it's not a skill but a feature
+    vp_cards.append({
+        "icon": VP_ICONS.get("observer", "\U0001f9e0"),
+        "skill": "observer",
+        "name": "Decision memory",
+        "desc": "Every choice you make is logged with your reasoning. Not what changed (git handles that) — but WHY you chose it.",
+        "agents": ["orchestrator"],
+    })
+    if utility_skills:
+        for us in utility_skills:
+            sk_name = us["name"]
+            if sk_name == "kickoff":
+                continue  # kickoff is shown in teams section
+            agent_ids = [agent_id(aname) for aname in us.get("agents", [])]
+            if not agent_ids:
+                agent_ids = ["orchestrator"]
+            vp_cards.append({
+                "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
+                "skill": sk_name,
+                "name": f"/{sk_name}",
+                "desc": us.get("description", "") or VP_DEFAULTS.get(sk_name, ""),
+                "agents": agent_ids,
+            })
+    else:
+        # Fallback: build from alternate_paths for non-plugin configs
+        for ap in alternate_paths:
+            sk_name = ap["name"]
+            if sk_name == "sprint" or sk_name == "kickoff":
+                continue
+            vp_cards.append({
+                "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
+                "skill": sk_name,
+                "name": f"/{sk_name}",
+                "desc": ap.get("description", "") or VP_DEFAULTS.get(sk_name, ""),
+                "agents": ["orchestrator"],
+            })
+        # Add well-known utility skills that might be in skills list
+        skills_by_name = {}
+        for sk in skills:
+            skills_by_name.setdefault(sk["name"], sk)  # first wins, like a linear scan
+        for sk_name in ["story", "scaffold", "help"]:
+            sk_obj = skills_by_name.get(sk_name)
+            if sk_obj and not any(v["skill"] == sk_name for v in vp_cards):
+                vp_cards.append({
+                    "icon": VP_ICONS.get(sk_name, "\u2699\ufe0f"),
+                    "skill": sk_name,
+                    "name": f"/{sk_name}",
+                    "desc": sk_obj.get("description", ""),
+                    "agents": ["orchestrator"],
+                })
+
+    # Sort VP cards by preferred display order
+    vp_key = _order_key(PREFERRED_VP_ORDER)
+    vp_cards.sort(key=lambda v: vp_key(v["skill"]))
+
+    # Build team data
+    team_data = []
+    for tm in teams:
+        members = []
+        for mname in tm.get("members", []):
+            members.append({
+                "id": agent_id(mname),
+                "name": mname,
+                "color": color_map.get(mname, FALLBACK_COLOR),
+            })
+        team_data.append({
+            "name": tm["name"],
+            "purpose": tm.get("description", ""),
+            "members": members,
+        })
+
+    # Build detail data for the panel (agent entries were added above)
+    skill_phase = {}  # skill_name -> phase label of its first lifecycle step
+    for step in lifecycle_steps:
+        if step["skill"] not in skill_phase:
+            skill_phase[step["skill"]] = PHASE_DEFS[step["phase"]]["label"] if step["phase"] < len(PHASE_DEFS) else ""
+    for sk in skills:
+        key = f"skill-{sk['name']}"
+        used_by = skill_users.get(sk["name"], [])
+        phase_name = skill_phase.get(sk["name"], "")
+        detail_data[key] = {
+            "type": "skill",
+            "name": f"/{sk['name']}",
+            "desc": sk.get("detail_description", "") or sk.get("description", ""),
+            "usedBy": used_by,
+            "phase": phase_name,
+        }
+    for i, tm in enumerate(teams):
+        key = f"team-{i}"
+        detail_data[key] = {
+            "type": "team",
+            "name": tm["name"],
+            "members": tm.get("members", []),
+            "desc": tm.get("description", ""),
+        }
+
+    # Hover index: hover key -> keys of every card it highlights. Cards use the
+    # DETAIL_DATA key scheme: agent-<id>, skill-<name> (incl. the sprint branch), team-<i>.
+    agent_ids = [a["id"] for a in agent_data]
+    has_sprint_branch = bool(sprint_alt) and any(st["skill"] == "build" for st in lifecycle_steps)
+    sprint_agents = [i for i in SPRINT_AGENT_IDS if i in agent_ids] if has_sprint_branch else []
+    card_agents = {}  # card key -> ids of the agents shown on it
+    for st in lifecycle_steps:
+        ids = card_agents.setdefault(f"skill-{st['skill']}", [])
+        ids.extend(sa["id"] for sa in st["agents"] if sa["id"] not in ids)
+    if sprint_agents:
+        ids = card_agents.setdefault("skill-sprint", [])
+        ids.extend(i for i in sprint_agents if i not in ids)
+    for i, tm in enumerate(team_data):
+        card_agents[f"team-{i}"] = [m["id"] for m in tm["members"]]
+    agent_cards = {}  # agent id -> card keys it appears on, in card order
+    for key, ids in card_agents.items():
+        for aid in ids:
+            cards = agent_cards.setdefault(aid, [])
+            if cards[-1:] != [key]:  # a team may list a member twice
+                cards.append(key)
+    highlight = {}
+    for aid in agent_ids:
+        key = f"agent-{aid}"
+        highlight[key] = [key] + agent_cards.get(aid, [])
+    for key, ids in card_agents.items():
+        related = [key] + [f"agent-{aid}" for aid in ids]
+        if key.startswith("team-"):
+            # Teams also light up every card any of their members appear on
+            member_cards = {k for aid in ids for k in agent_cards.get(aid, ())}
+            related += [k for k in card_agents if k != key and k in member_cards]
+        highlight[key] = related
+
+    # One CSS rule per hover key un-dims the cards whose data-rel names it
+    highlight_css = ",".join(
+        f'.page[data-hl={_css_str(tok)}] [data-rel~={_css_str(tok)}]'
+        for tok in map(_hover_token, highlight)
+    )
+    if highlight_css:
+        highlight_css += "{opacity:1}"
+    rel = {}  # card key -> hover keys that light it up (highlight inverted)
+    for key, targets in highlight.items():
+        for target in targets:
+            rel.setdefault(target, []).append(key)
+
+    def card_attrs(panel_key, hl_key=None):
+        attrs = f' data-panel="{e(panel_key)}"'
+        if hl_key:
+            attrs += f' data-key="{e(_hover_token(hl_key))}"'
+            if hl_key in rel:
+                attrs += f' data-rel="{e(" ".join(map(_hover_token, rel[hl_key])))}"'
+        return attrs
+
+    def agent_row(color, name, role):
+        return (f'<div class="step-agent-row"><span class="step-agent-chip" style="--agent-color:{e(color)}">'
+                f'<span class="cdot"></span>{e(name)}</span><span class="step-agent-role">{e(role)}</span></div>')
+
+    # -- Cards, rendered here so the page builds no DOM on load --
+    agent_by_id = {a["id"]: a for a in agent_data}
+    agent_cards_html = "".join(
+        f'<div class="agent-card dimmable reveal" style="--agent-color:{e(a["color"])}"'
+        f'{card_attrs("agent-" + a["id"], "agent-" + a["id"])}>'
+        f'<div class="agent-top"><span class="agent-dot"></span><span class="agent-name">{e(a["name"])}</span></div>'
+        f'<div class="agent-role">{e(a["desc"])}</div></div>'
+        for a in agent_data
+    )
+
+    workflow_parts = []
+    cur_phase = -1
+    for step in lifecycle_steps:
+        if step["phase"] != cur_phase:
+            cur_phase = step["phase"]
+            phase = PHASE_DEFS[cur_phase] if cur_phase < len(PHASE_DEFS) else {"label": f"Phase {cur_phase}", "color": FALLBACK_COLOR}
+            workflow_parts.append(f'<div class="phase-label reveal" style="--phase-color:{e(phase["color"])}">{e(phase["label"])}</div>')
+        rows = "".join(agent_row(sa["color"], sa["name"], sa["role"]) for sa in step["agents"])
+        workflow_parts.append(
+            f'<div class="step-card dimmable reveal"{card_attrs("skill-" + step["skill"], "skill-" + step["skill"])}>'
+            f'<div class="step-header"><span class="step-skill">/{e(step["skill"])}</span><span class="step-desc">{e(step["desc"])}</span></div>'
+            + (f'<div class="step-agents">{rows}</div>' if rows else "") + '</div>'
+        )
+        # Sprint branch after /build
+        if step["skill"] == "build" and sprint_alt:
+            rows = "".join(agent_row(agent_by_id[i]["color"], agent_by_id[i]["name"], agent_by_id[i]["desc"])
+                           for i in sprint_agents)
+            sprint_desc = sprint_alt.get("description") or "Batch-execute multiple tickets in parallel"
+            workflow_parts.append(
+                f'<div class="sprint-branch dimmable reveal"{card_attrs("vp-sprint", "skill-sprint")}>'
+                f'<div class="sprint-or">or batch-execute with</div><div class="sprint-header">/sprint</div>'
+                f'<div class="sprint-desc">{e(sprint_desc)}</div>'
+                + (f'<div class="step-agents" style="border:0;padding:0;margin:0">{rows}</div>' if rows else "") + '</div>'
+            )
+    workflow_html = "".join(workflow_parts)
+
+    # Configs may list VP agents by display name; index those forms once
+    agent_by_slug = {}
+    for a in agent_data:
+        low = a["name"].lower()
+        agent_by_slug.setdefault("-".join(low.split()), a)
+        agent_by_slug.setdefault(low, a)
+
+    def vp_chip(aid):
+        color, label = "var(--orchestrator)", aid
+        if aid == "orchestrator":
+            label = "Orchestrator"
+        else:
+            ag = agent_by_id.get(aid) or agent_by_slug.get(aid)
+            if ag:
+                color, label = ag["color"], ag["name"]
+        return f'<span class="vp-chip" style="--chip-color:{e(color)}"><span class="cdot"></span>{e(label)}</span>'
+
+    vp_cards_html = "".join(
+        f'<div class="vp-card reveal"{card_attrs("vp-" + vp["skill"])}><div class="vp-icon">{e(vp["icon"])}</div>'
+        f'<div class="vp-name">{e(vp["name"])}</div><div class="vp-desc">{e(vp["desc"])}</div>'
+        f'<div class="vp-agents">{"".join(vp_chip(aid) for aid in vp["agents"])}</div></div>'
+        for vp in vp_cards
+    )
+
+    team_cards_html = "".join(
+        f'<div class="team-card dimmable reveal"{card_attrs(f"team-{i}", f"team-{i}")}>'
+        f'<div class="team-name">{e(tm["name"])}</div><div class="team-purpose">{e(tm["purpose"] or "")}</div>'
+        f'<div class="team-members">'
+        + "".join(f'<span class="team-member" style="--member-color:{e(m["color"])}"><span class="cdot"></span>{e(m["name"])}</span>'
+                  for m in tm["members"])
+        + '</div></div>'
+        for i, tm in enumerate(team_data)
+    )
+
+    # Serialize the panel data to JSON in one pass, escaping </ for script safety
+    data_json = json.dumps({
+        "AGENTS": agent_data,
+        "LIFECYCLE": lifecycle_steps,
+        "PHASES": PHASE_DEFS,
+        "VP_CARDS": vp_cards,
+        "TEAMS": team_data,
+        "DETAIL_DATA": detail_data,
+    }, ensure_ascii=False, separators=(",", ":")).replace('</', r'<\/')
+
+    escaped_name = e(name)
+
+    # -- OG meta tags (marketing mode only) --
+    if marketing:
+        og_tags = """
+<meta name="description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
+<meta property="og:title" content="Solopreneur — Your Virtual AI Company">
+<meta property="og:description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
+<meta property="og:image" content="https://pcatattacks.github.io/solopreneur-plugin/og-image.png">
+<meta property="og:url" content="https://pcatattacks.github.io/solopreneur-plugin/">
+<meta property="og:type" content="website">
+<meta name="twitter:card" content="summary_large_image">
+<meta name="twitter:title" content="Solopreneur — Your Virtual AI Company">
+<meta name="twitter:description" content="A Claude Code plugin that gives you a full AI team — engineer, designer, researcher, QA, and more. Ship products faster as a team of one.">
+<meta name="twitter:image" content="https://pcatattacks.github.io/solopreneur-plugin/og-image.png">"""
+    else:
+        og_tags = ""
+
+    # -- Hero / header section --
+    # The icons are defined once as <symbol>s; each button <use>s both and the
+    # .copied class switches which one shows
+    copy_svg = ('<svg class="ico-copy" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><use href="#ico-copy"/></svg>'
+                '<svg class="ico-check" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2.5"><use href="#ico-check"/></svg>')
+    if marketing:
+        # Each copy button carries its command, so copying reads no other node
+        install_steps = "".join(f"""
+      <div class="install-step">
+        <span class="install-num">{i}</span>
+        <code>{e(cmd)}</code>
+        <button class="copy-btn" data-cmd="{e(cmd)}" onclick="copyCmd(this)">{copy_svg}</button>
+      </div>""" for i, cmd in enumerate(INSTALL_COMMANDS, 1))
+        hero_html = f"""
+  <svg width="0" height="0" style="position:absolute" aria-hidden="true"><symbol id="ico-copy" viewBox="0 0 24 24"><rect x="9" y="9" width="13" height="13" rx="2"/><path d="M5 15H4a2 2 0 01-2-2V4a2 2 0 012-2h9a2 2 0 012 2v1"/></symbol><symbol id="ico-check" viewBox="0 0 24 24"><polyline points="20 6 9 17 4 12"/></symbol></svg>
+  <div class="hero">
+    <div class="pill reveal">Claude Code Plugin</div>
+    <h1 class="hero-title reveal">{escaped_name}</h1>
+    <p class="hero-tagline reveal">Your Virtual AI Company</p>
+    <p class="hero-desc reveal">A Claude Code plugin that gives you a full AI team &mdash; specialized agents, guided workflows, and decision memory. Ship products faster as a team of one.</p>
+    <p class="hero-install-label reveal">Open Claude Code in your terminal and run:</p>
+    <div class="install-steps reveal">{install_steps}
+    </div>
+    <p class="install-prereq reveal">New to Claude Code? <a href="https://code.claude.com/docs/en/quickstart" target="_blank" rel="noopener">Start here &rarr;</a></p>
+    <div class="hero-link-wrap reveal">
+      <a class="hero-link" href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener">
+        <svg viewBox="0 0 24 24" fill="currentColor"><path d="M12 0C5.37 0 0 5.37 0 12c0 5.31 3.435 9.795 8.205 11.385.6.105.825-.255.825-.57 0-.285-.015-1.23-.015-2.235-3.015.555-3.795-.735-4.035-1.41-.135-.345-.72-1.41-1.23-1.695-.42-.225-1.02-.78-.015-.795.945-.015 1.62.87 1.845 1.23 1.08 1.815 2.805 1.305 3.495.99.105-.78.42-1.305.765-1.605-2.67-.3-5.46-1.335-5.46-5.925 0-1.305.465-2.385 1.23-3.225-.12-.3-.54-1.53.12-3.18 0 0 1.005-.315 3.3 1.23.96-.27 1.98-.405 3-.405s2.04.135 3 .405c2.295-1.56 3.3-1.23 3.3-1.23.66 1.65.24 2.88.12 3.18.765.84 1.23 1.905 1.23 3.225 0 4.605-2.805 5.625-5.475 5.925.435.375.81 1.095.81 2.22 0 1.605-.015 2.895-.015 3.3 0 .315.225.69.825.57A12.02 12.02 0 0024 12c0-6.63-5.37-12-12-12z"/></svg>
+        View on GitHub
+      </a>
+    </div>
+  </div>"""
+        footer_html = """
+  <div class="footer">
+    <div class="footer-name reveal">Built by <strong>Pranav Dhingra</strong></div>
+    <div class="footer-links reveal">
+      <a href="https://pranavdhingra.com" target="_blank" rel="noopener">Portfolio</a>
+      <a href="https://linkedin.com/in/pranav-dhingra" target="_blank" rel="noopener">LinkedIn</a>
+      <a href="https://github.com/pcatattacks" target="_blank" rel="noopener">GitHub</a>
+      <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener" style="color:#fbbf24">&#9733; Star</a>
+    </div>
+  </div>"""
+    else:
+        hero_html = f"""
+  <div class="hero hero-simple">
+    <h1 class="hero-title reveal">{escaped_name}</h1>
+    <p class="hero-tagline reveal">AI Org Chart</p>
+  </div>"""
+        footer_html = """
+  <div class="footer">
+    <div class="footer-name reveal">Built with the <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener" style="color:var(--text-secondary);text-decoration:none">Solopreneur plugin</a> for Claude Code</div>
+  </div>"""
+
+    # Star CTA (marketing mode only — shown after VP section)
+    star_svg = '<svg viewBox="0 0 24 24"><path d="M12 .587l3.668 7.431 8.2 1.192-5.934 5.787 1.4 8.168L12 19.896l-7.334 3.269 1.4-8.168L.132 9.21l8.2-1.192z"/></svg>'
+    if marketing:
+        star_cta_html = f"""
+    <div class="star-cta reveal">
+      <a href="https://github.com/pcatattacks/solopreneur-plugin" target="_blank" rel="noopener">
+        {star_svg} Star on GitHub
+      </a>
+    </div>"""
+    else:
+        star_cta_html = ""
+
+    # Beyond-the-lifecycle section (marketing mode only — custom orgs skip this)
+    if marketing:
+        beyond_section_html = f"""
+  <!-- Beyond the lifecycle -->
+  <div class="section" id="beyond-section">
+    <div class="section-eyebrow reveal">Beyond the lifecycle</div>
+    <div class="section-heading reveal">What makes {escaped_name} different</div>
+    <div class="section-desc reveal">The lifecycle gets your product built. These capabilities make the whole experience smarter.</div>
+    <div class="vp-grid" id="vp-grid">{vp_cards_html}</div>{star_cta_html}
+  </div>"""
+    else:
+        beyond_section_html = ""
+
+    # Build the mini-dots for the HiW flow from actual agent data
+    hiw_dots = "".join(
+        f'<span class="mini-dot" style="background:{color_map.get(agent["name"], FALLBACK_COLOR)}"></span>'
+        for agent in agents[:8]
+    )
+    if not hiw_dots:
+        hiw_dots = '<span class="mini-dot" style="background:#3b82f6"></span>'
+
+    return PAGE_TEMPLATE.substitute(
+        escaped_name=escaped_name,
+        og_tags=og_tags,
+        hero_html=hero_html,
+        hiw_dots=hiw_dots,
+        agent_count=len(agents),
+        agent_plural="s" if len(agents) != 1 else "",
+        step_count=len(lifecycle),
+        agent_cards_html=agent_cards_html,
+        workflow_html=workflow_html,
+        team_cards_html=team_cards_html,
+        beyond_section_html=beyond_section_html,
+        footer_html=footer_html,
+        highlight_css=highlight_css,
+        data_json=data_json,
+    )
 
 
 def main():
@@ -1655,8 +1892,7 @@ def main():
     args = parser.parse_args()
 
     if args.config:
-        with open(args.config) as f:
-            config = json.load(f)
+        config = _load_json(args.config)
     elif args.plugin_dir:
         config = build_from_plugin(args.plugin_dir)
     else:
@@ -1664,8 +1900,7 @@ def main():
 
     html_content = generate_html(config, marketing=args.marketing)
 
-    with open(args.output, "w") as f:
-        f.write(html_content)
+    _write_text(args.output, html_content)
 
     print(f"Org chart generated: {args.output}")
     print(f"Open in your browser: open {args.output}")